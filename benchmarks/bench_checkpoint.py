@@ -0,0 +1,77 @@
+"""
+Checkpointing benchmark: time the training loop is paused per checkpoint with the
+background Checkpointer versus writing the same snapshot synchronously.
+
+Usage:
+    python benchmarks/bench_checkpoint.py [--checkpoints 20]
+"""
+
+import argparse
+import os
+import pickle
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+from foundation import LBFGS, MLP, Checkpointer  # noqa: E402
+
+
+def synchronous_save(directory: str, epoch: int, parameters, optimizer) -> None:
+    """
+    Snapshot, serialize and fsync in the training thread.
+    """
+    path = os.path.join(directory, f"sync-{epoch:08d}.pkl")
+    snapshot = {
+        "epoch": epoch,
+        "parameters": [param.data for param in parameters],
+        "optimizer": optimizer.state(),
+    }
+    with open(path + ".tmp", "wb") as file:
+        pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(path + ".tmp", path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--checkpoints", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'params':>8} {'sync pause ms':>14} {'async pause ms':>15}")
+
+    for no_inputs, layers in [(16, [32, 32, 1]), (256, [256, 256, 1])]:
+        model = MLP(no_inputs=no_inputs, no_layer_outputs=layers, seed=0)
+        parameters = model.parameters()
+        optimizer = LBFGS(history_size=10)
+        optimizer.parameters = parameters
+
+        with tempfile.TemporaryDirectory() as directory:
+            checkpointer = Checkpointer(directory, keep=3)
+            sync, background = [], []
+
+            for epoch in range(args.checkpoints):
+                start = time.perf_counter()
+                synchronous_save(directory, epoch, parameters, optimizer)
+                sync.append((time.perf_counter() - start) * 1000)
+
+                start = time.perf_counter()
+                checkpointer.save(epoch, parameters, optimizer)
+                background.append((time.perf_counter() - start) * 1000)
+                checkpointer.flush()  # outside the timed region, keeps runs comparable
+
+            checkpointer.close()
+
+        print(
+            f"{len(parameters):>8} {statistics.median(sync):>14.2f} "
+            f"{statistics.median(background):>15.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
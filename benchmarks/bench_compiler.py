@@ -0,0 +1,83 @@
+"""
+Compiler benchmark: one full-batch training step (forward, mse loss, backward)
+interpreted through Scalar.backward versus the generated code of compile_loss.
+
+Usage:
+    python benchmarks/bench_compiler.py [--repeats 10]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+from foundation import (
+    MLP,
+    compile_forward,
+    compile_loss,
+    mean_squared_error,
+)  # noqa: E402
+
+
+def median_ms(fn, repeats: int) -> float:
+    """
+    Returns the median wall-clock time of fn() in milliseconds.
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return sorted(timings)[len(timings) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(
+        f"{'architecture':<20} {'batch':>5} {'compile ms':>11} "
+        f"{'interp ms':>10} {'compiled ms':>12} {'speedup':>8}"
+    )
+
+    for no_inputs, layers, batch_size in [
+        (3, [4, 4, 1], 4),
+        (8, [16, 16, 1], 16),
+        (16, [32, 32, 1], 32),
+    ]:
+        model = MLP(no_inputs=no_inputs, no_layer_outputs=layers, seed=0)
+        xs = [
+            [random.uniform(-1, 1) for _ in range(no_inputs)] for _ in range(batch_size)
+        ]
+        ys = [random.uniform(-1, 1) for _ in range(batch_size)]
+
+        def interpreted():
+            loss = mean_squared_error(ys, model.forward(xs))
+            loss.backward()
+
+        def compiled():
+            kernel(xs, ys, [param.data for param in model.parameters()])
+
+        start = time.perf_counter()
+        kernel = compile_loss(model)
+        compile_forward(model)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        interpreted_ms = median_ms(interpreted, repeats=args.repeats)
+        compiled_ms = median_ms(compiled, repeats=args.repeats)
+        print(
+            f"{str([no_inputs] + layers):<20} {batch_size:>5} {compile_ms:>11.1f} "
+            f"{interpreted_ms:>10.2f} {compiled_ms:>12.2f} "
+            f"{interpreted_ms / compiled_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
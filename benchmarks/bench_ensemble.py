@@ -0,0 +1,60 @@
+"""
+Ensemble benchmark: training K models of the README architecture one by one with
+MLP.fit (interpreted and compiled) versus all at once with Ensemble.fit.
+
+Usage:
+    python benchmarks/bench_ensemble.py [--models 32] [--epochs 200]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+from foundation import MLP, SGD, make_ensemble  # noqa: E402
+
+XS = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5], [0.5, 1.0, 3.0], [3.0, 1.0, -1.0]]
+YS = [1.0, -1.0, -1.0, 1.0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=32)
+    parser.add_argument("--epochs", type=int, default=200)
+    args = parser.parse_args()
+
+    seeds = list(range(args.models))
+    learning_rates = [0.01 + 0.1 * k / args.models for k in seeds]
+    timings = {}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name, compiled in (("MLP.fit", False), ("MLP.fit compiled", True)):
+            start = time.perf_counter()
+            for seed, learning_rate in zip(seeds, learning_rates):
+                model = MLP(no_inputs=3, no_layer_outputs=[4, 4, 1], seed=seed)
+                model.fit(XS, YS, SGD(learning_rate), args.epochs, compiled=compiled)
+            timings[name] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        models = make_ensemble(no_inputs=3, no_layer_outputs=[4, 4, 1], seeds=seeds)
+        histories = models.fit(XS, YS, learning_rates, args.epochs)
+        timings["Ensemble.fit"] = time.perf_counter() - start
+
+    print(f"{args.models} x MLP [3, 4, 4, 1], {args.epochs} epochs")
+    for name, seconds in timings.items():
+        print(f"{name:<18} {seconds:>8.3f} s")
+
+    best = min(range(args.models), key=lambda k: histories[k]["loss"][-1])
+    print(
+        f"best model: lr {learning_rates[best]:.4f} loss {histories[best]['loss'][-1]:.6f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
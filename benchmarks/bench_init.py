@@ -0,0 +1,64 @@
+"""
+Initialization benchmark: construction time of wide MLPs with the vectorized
+initializers versus drawing every weight with random.uniform.
+
+Both still allocate one Scalar per weight, which dominates for wide models.
+
+Usage:
+    python benchmarks/bench_init.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+from foundation import MLP, Scalar  # noqa: E402
+
+
+def per_weight(no_inputs: int, no_layer_outputs: list[int]) -> list:
+    """
+    The previous construction: one random.uniform call and Scalar per weight.
+    """
+    sizes = [no_inputs] + no_layer_outputs
+    return [
+        [
+            [Scalar(data=random.uniform(-1, 1)) for _ in range(sizes[i] + 1)]
+            for _ in range(sizes[i + 1])
+        ]
+        for i in range(len(no_layer_outputs))
+    ]
+
+
+def main() -> None:
+    print(
+        f"{'architecture':<26} {'params':>10} {'per weight s':>13} {'vectorized s':>13}"
+    )
+
+    for no_inputs, layers in [
+        (64, [64, 64, 1]),
+        (256, [256, 256, 1]),
+        (1024, [1024, 1024]),
+        (1024, [1024, 1024, 1024]),
+    ]:
+        start = time.perf_counter()
+        per_weight(no_inputs, layers)
+        per_weight_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        model = MLP(no_inputs=no_inputs, no_layer_outputs=layers, init="xavier", seed=0)
+        vectorized_s = time.perf_counter() - start
+
+        print(
+            f"{str([no_inputs] + layers):<26} {len(model.parameters()):>10} "
+            f"{per_weight_s:>13.2f} {vectorized_s:>13.2f}"
+        )
+        del model
+
+
+if __name__ == "__main__":
+    main()
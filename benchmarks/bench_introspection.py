@@ -0,0 +1,72 @@
+"""
+Graph introspection report: size of the loss graph behind one full-batch epoch for
+growing models, and live scalars across epochs with and without a leak.
+
+Usage:
+    python benchmarks/bench_introspection.py [--epochs 5]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+from foundation import MLP, SGD, GraphMonitor, model_graph_stats  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--epochs", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(
+        f"{'architecture':<18} {'batch':>5} {'nodes':>8} {'depth':>6} "
+        f"{'closures':>8} {'constants':>9} {'KiB':>9}"
+    )
+
+    for no_inputs, layers, batch_size in [
+        (3, [4, 4, 1], 4),
+        (8, [16, 16, 1], 16),
+        (16, [32, 32, 1], 32),
+    ]:
+        model = MLP(no_inputs=no_inputs, no_layer_outputs=layers, seed=0)
+        xs = [
+            [random.uniform(-1, 1) for _ in range(no_inputs)] for _ in range(batch_size)
+        ]
+        ys = [random.uniform(-1, 1) for _ in range(batch_size)]
+        stats = model_graph_stats(model, xs, ys)
+        print(
+            f"{str([no_inputs] + layers):<18} {batch_size:>5} {stats.nodes:>8} "
+            f"{stats.depth:>6} {stats.closures:>8} {stats.constants:>9} "
+            f"{stats.nbytes / 1024:>9.1f}"
+        )
+
+    xs = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5], [0.5, 1.0, 3.0], [3.0, 1.0, -1.0]]
+    ys = [1.0, -1.0, -1.0, 1.0]
+    model = MLP(no_inputs=3, no_layer_outputs=[4, 4, 1], seed=0)
+    monitor = GraphMonitor(track_live=True)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        model.fit(xs, ys, SGD(learning_rate=0.05), args.epochs, monitor=monitor)
+    print(f"\nfit, {args.epochs} epochs: live scalars {monitor.live}")
+
+    # a leak: keeping every epoch's loss graph alive
+    leaked = []
+    monitor = GraphMonitor(track_live=True)
+    for _ in range(args.epochs):
+        loss = sum((model(x)[0] - y) ** 2 for x, y in zip(xs, ys))
+        leaked.append(loss)
+        monitor.record(loss, model.parameters())
+    print(f"leaking loop:           live scalars {monitor.live}")
+    print(f"growth: {monitor.growth()}")
+
+
+if __name__ == "__main__":
+    main()
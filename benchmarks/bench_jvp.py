@@ -0,0 +1,81 @@
+"""
+Forward-mode benchmark: Jacobian-vector products via MLP.jvp versus reverse mode.
+
+Reverse mode needs one graph and one backward() per output to get J @ v, forward
+mode gets all outputs' directional derivatives in a single graph-free pass.
+
+Usage:
+    python benchmarks/bench_jvp.py [--repeats 20]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+from foundation import MLP, Scalar  # noqa: E402
+
+
+def reverse_jvp(model: MLP, x: list[float], v: list[float]) -> list[float]:
+    """
+    J @ v computed with reverse mode, one backward pass per output.
+    """
+    tangents = []
+    for index in range(len(model.layers[-1].neurons)):
+        for param in model.parameters():
+            param.grad = 0.0
+        inputs = [Scalar(x_i) for x_i in x]
+        out = model(inputs)[index]
+        out.backward()
+        tangents.append(sum(x_i.grad * v_i for x_i, v_i in zip(inputs, v)))
+    return tangents
+
+
+def measure(fn, repeats: int) -> tuple[float, float]:
+    """
+    Returns the median time in ms and the peak traced memory in KiB of fn().
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return sorted(timings)[len(timings) // 2], peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(f"{'architecture':<22} {'mode':<8} {'median ms':>10} {'peak KiB':>10}")
+
+    for no_inputs, layers in [(3, [4, 4, 1]), (16, [32, 32, 4]), (64, [64, 64, 8])]:
+        model = MLP(no_inputs=no_inputs, no_layer_outputs=layers, seed=0)
+        x = [random.uniform(-1, 1) for _ in range(no_inputs)]
+        v = [random.uniform(-1, 1) for _ in range(no_inputs)]
+        name = f"{no_inputs}->{layers}"
+
+        for mode, fn in (
+            ("reverse", lambda: reverse_jvp(model, x, v)),
+            ("forward", lambda: model.jvp(x, v)),
+        ):
+            ms, kib = measure(fn, repeats=args.repeats)
+            print(f"{name:<22} {mode:<8} {ms:>10.3f} {kib:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+L-BFGS benchmark: wall-clock time to reach a target loss on the full-batch README
+regression problem with SGD versus LBFGS.
+
+Usage:
+    python benchmarks/bench_lbfgs.py [--target 1e-3] [--seeds 5]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+from foundation import LBFGS, MLP, SGD  # noqa: E402
+
+XS = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5], [0.5, 1.0, 3.0], [3.0, 1.0, -1.0]]
+YS = [1.0, -1.0, -1.0, 1.0]
+MAX_EPOCHS = 5000
+
+
+def time_to_target(optimizer, seed: int, target: float, compiled: bool) -> tuple:
+    """
+    Trains until the loss drops below the target.
+
+    Returns:
+        seconds, epochs: tuple
+            wall-clock time and no of epochs, epochs is None if the target was missed
+    """
+    model = MLP(no_inputs=3, no_layer_outputs=[4, 4, 1], seed=seed)
+    epochs = 0
+    start = time.perf_counter()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        while epochs < MAX_EPOCHS:
+            loss = model.fit(XS, YS, optimizer, epochs=1, compiled=compiled)["loss"][0]
+            if loss < target:
+                return time.perf_counter() - start, epochs
+            epochs += 1
+
+    return time.perf_counter() - start, None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--target", type=float, default=1e-3)
+    parser.add_argument("--seeds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"MLP [3, 4, 4, 1], target loss {args.target}, median of {args.seeds} seeds")
+    print(f"{'optimizer':<10} {'compiled':>8} {'epochs':>8} {'seconds':>9}")
+
+    for compiled in (False, True):
+        for name, optimizer in (("SGD", SGD), ("LBFGS", LBFGS)):
+            runs = [
+                time_to_target(
+                    SGD(learning_rate=0.05) if optimizer is SGD else LBFGS(),
+                    seed=seed,
+                    target=args.target,
+                    compiled=compiled,
+                )
+                for seed in range(args.seeds)
+            ]
+            reached = [epochs for _, epochs in runs if epochs is not None]
+            epochs = statistics.median(reached) if reached else float("nan")
+            seconds = statistics.median(seconds for seconds, _ in runs)
+            print(f"{name:<10} {str(compiled):>8} {epochs:>8} {seconds:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Online learning benchmark: per-update latency of MLP.partial_fit while consuming a
+generator of small batches, versus calling MLP.fit(epochs=1) per batch.
+
+Usage:
+    python benchmarks/bench_partial_fit.py [--updates 2000]
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Iterator
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+from foundation import MLP, SGD  # noqa: E402
+
+NO_INPUTS = 3
+
+
+def stream(batch_size: int) -> Iterator[tuple[list[list[float]], list[float]]]:
+    """
+    Endless stream of small regression batches.
+    """
+    rng = random.Random(0)
+    while True:
+        x = [[rng.uniform(-1, 1) for _ in range(NO_INPUTS)] for _ in range(batch_size)]
+        yield x, [math.tanh(x_i[0] - 2 * x_i[1] + x_i[2]) for x_i in x]
+
+
+def latencies(update, batches, updates: int) -> list[float]:
+    """
+    Per-update wall-clock time in microseconds.
+    """
+    timings = []
+    for _, (x, y) in zip(range(updates), batches):
+        start = time.perf_counter()
+        update(x, y)
+        timings.append((time.perf_counter() - start) * 1e6)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--updates", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"MLP [{NO_INPUTS}, 8, 8, 1], SGD, {args.updates} updates")
+    print(f"{'method':<28} {'batch':>5} {'p50 us':>9} {'p99 us':>9}")
+
+    for batch_size in (1, 4, 16):
+        for name, compiled, online in (
+            ("fit(epochs=1)", False, False),
+            ("partial_fit", False, True),
+            ("fit(epochs=1, compiled)", True, False),
+            ("partial_fit(compiled)", True, True),
+        ):
+            model = MLP(no_inputs=NO_INPUTS, no_layer_outputs=[8, 8, 1], seed=0)
+            optimizer = SGD(learning_rate=0.05)
+
+            if online:
+
+                def update(x, y):
+                    model.partial_fit(x, y, optimizer, compiled=compiled)
+
+            else:
+
+                def update(x, y):
+                    model.fit(x, y, optimizer, epochs=1, compiled=compiled)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                timings = latencies(update, stream(batch_size), args.updates)
+
+            p50 = statistics.median(timings)
+            p99 = statistics.quantiles(timings, n=100)[98]
+            print(f"{name:<28} {batch_size:>5} {p50:>9.1f} {p99:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
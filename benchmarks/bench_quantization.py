@@ -0,0 +1,84 @@
+"""
+Quantization benchmark: accuracy delta and throughput of the int8 QuantizedMLP
+versus the float Scalar forward pass and the compiled float forward pass.
+
+Usage:
+    python benchmarks/bench_quantization.py [--batch 1024] [--epochs 100]
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+import numpy as np  # noqa: E402
+
+from foundation import MLP, SGD, quantize  # noqa: E402
+
+NO_INPUTS = 8
+
+
+def target(x: list[float]) -> float:
+    """
+    Synthetic regression target in (-1, 1).
+    """
+    return math.tanh(sum(math.sin(i + 1) * x_i for i, x_i in enumerate(x)))
+
+
+def samples_per_second(fn, no_samples: int) -> float:
+    """
+    Runs fn() once and returns the throughput in samples per second.
+    """
+    start = time.perf_counter()
+    fn()
+    return no_samples / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch", type=int, default=1024)
+    parser.add_argument("--epochs", type=int, default=100)
+    args = parser.parse_args()
+
+    random.seed(0)
+    train_x = [[random.uniform(-1, 1) for _ in range(NO_INPUTS)] for _ in range(32)]
+    train_y = [target(x) for x in train_x]
+    test_x = [
+        [random.uniform(-1, 1) for _ in range(NO_INPUTS)] for _ in range(args.batch)
+    ]
+    test_y = np.array([target(x) for x in test_x])
+
+    model = MLP(no_inputs=NO_INPUTS, no_layer_outputs=[32, 32, 1], seed=0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        model.fit(train_x, train_y, SGD(learning_rate=0.01), args.epochs, compiled=True)
+
+    quantized = quantize(model, train_x)
+    float_preds = np.array(model.predict(test_x))[:, 0]
+    int8_preds = quantized.predict(test_x)[:, 0]
+
+    float_bytes = 8 * len(model.parameters())
+    print(f"MLP {[NO_INPUTS, 32, 32, 1]}, {args.batch} test samples")
+    print(f"weights: float64 {float_bytes} bytes, int8 {quantized.nbytes} bytes")
+    print(f"test mse float: {np.mean((float_preds - test_y) ** 2):.6f}")
+    print(f"test mse int8:  {np.mean((int8_preds - test_y) ** 2):.6f}")
+    print(f"max |float - int8|: {np.max(np.abs(float_preds - int8_preds)):.6f}")
+
+    batch = np.asarray(test_x, dtype=np.float32)
+    for name, fn in (
+        ("scalar forward", lambda: model.forward(test_x)),
+        ("compiled predict", lambda: model.predict(test_x)),
+        ("int8 predict", lambda: quantized.predict(batch)),
+    ):
+        print(f"{name:<17} {samples_per_second(fn, args.batch):>12.0f} samples/s")
+
+
+if __name__ == "__main__":
+    main()
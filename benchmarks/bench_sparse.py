@@ -0,0 +1,82 @@
+"""
+Sparse layer benchmark: memory and latency of pruned MLPs stored dense versus as
+CSR SparseLayers at 50/90/99% sparsity.
+
+Usage:
+    python benchmarks/bench_sparse.py [--repeats 5]
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+from foundation import MLP, prune, sparsify  # noqa: E402
+
+NO_INPUTS = 128
+LAYERS = [128, 128, 1]
+
+
+def retained_kib(model: MLP) -> float:
+    """
+    Memory retained by a deep copy of the model in KiB.
+    """
+    tracemalloc.start()
+    clone = copy.deepcopy(model)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del clone
+    return size / 1024
+
+
+def median_ms(fn, repeats: int) -> float:
+    """
+    Returns the median wall-clock time of fn() in milliseconds.
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return sorted(timings)[len(timings) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    x = [random.uniform(-1, 1) for _ in range(NO_INPUTS)]
+    print(f"MLP {[NO_INPUTS] + LAYERS}, single sample")
+    print(
+        f"{'sparsity':>8} {'storage':>8} {'params':>8} {'memory KiB':>11} "
+        f"{'forward ms':>11} {'fwd+bwd ms':>11}"
+    )
+
+    for sparsity in (0.0, 0.5, 0.9, 0.99):
+        model = prune(
+            MLP(no_inputs=NO_INPUTS, no_layer_outputs=LAYERS, seed=0), sparsity
+        )
+        models = [("dense", model)]
+        if sparsity > 0:
+            models.append(("csr", sparsify(copy.deepcopy(model))))
+
+        for storage, candidate in models:
+            forward_ms = median_ms(lambda: candidate(x), repeats=args.repeats)
+            backward_ms = median_ms(lambda: candidate(x)[0].backward(), args.repeats)
+            print(
+                f"{sparsity:>8.0%} {storage:>8} {len(candidate.parameters()):>8} "
+                f"{retained_kib(candidate):>11.1f} {forward_ms:>11.2f} {backward_ms:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Startup benchmark: measures the wall-clock cost of importing the package in a fresh interpreter.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeats 20]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+SNIPPETS = {
+    "python (baseline)": "pass",
+    "import foundation": "import foundation",
+    "foundation.Scalar": "import foundation; foundation.Scalar",
+    "foundation.MLP + SGD": "import foundation; foundation.MLP; foundation.SGD",
+    "foundation.draw_graph": "import foundation; foundation.draw_graph",
+}
+
+
+def time_snippet(snippet: str, repeats: int) -> list[float]:
+    """
+    Runs a snippet in a fresh interpreter several times.
+
+    Parameters:
+        snippet: str
+            the python code to run
+        repeats: int
+            how often to run it
+
+    Returns:
+        timings: list[float]
+            wall-clock time in milliseconds per run
+    """
+    env = dict(os.environ, PYTHONPATH=SRC)
+    timings = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", snippet], env=env, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'snippet':<25} {'median ms':>10} {'min ms':>10}")
+    for name, snippet in SNIPPETS.items():
+        timings = time_snippet(snippet=snippet, repeats=args.repeats)
+        print(f"{name:<25} {statistics.median(timings):>10.2f} {min(timings):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
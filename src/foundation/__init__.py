@@ -0,0 +1,91 @@
+"""
+A tiny neural net library built from scratch.
+
+Submodules are loaded lazily on first attribute access, so `import foundation`
+stays cheap and optional dependencies (e.g. graphviz) are only imported when used.
+"""
+
+import importlib
+
+# public name => submodule it lives in
+_LAZY_ATTRIBUTES = {
+    "Scalar": "core",
+    "Vector": "core",
+    "Graph": "core",
+    "Dual": "core",
+    "Checkpointer": "checkpoint",
+    "load_checkpoint": "checkpoint",
+    "compile_graph": "compiler",
+    "compile_forward": "compiler",
+    "compile_loss": "compiler",
+    "Ensemble": "ensemble",
+    "make_ensemble": "ensemble",
+    "stack": "ensemble",
+    "GraphMonitor": "introspection",
+    "GraphStats": "introspection",
+    "graph_stats": "introspection",
+    "model_graph_stats": "introspection",
+    "live_scalars": "introspection",
+    "mean_squared_error": "metrics",
+    "Module": "nn",
+    "Neuron": "nn",
+    "Layer": "nn",
+    "SparseLayer": "nn",
+    "MLP": "nn",
+    "prune": "nn",
+    "sparsify": "nn",
+    "jvp": "nn",
+    "Optimizer": "optimizers",
+    "SGD": "optimizers",
+    "LBFGS": "lbfgs",
+    "QuantizedMLP": "quantization",
+    "quantize": "quantization",
+    "trace": "visualisation",
+    "draw_graph": "visualisation",
+}
+
+_SUBMODULES = {
+    "checkpoint",
+    "compiler",
+    "core",
+    "ensemble",
+    "initializers",
+    "introspection",
+    "lbfgs",
+    "metrics",
+    "nn",
+    "optimizers",
+    "quantization",
+    "visualisation",
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES) + sorted(_SUBMODULES)
+
+
+def __getattr__(name: str) -> object:
+    """
+    Lazily imports submodules and the public names they define.
+
+    Parameters:
+        name: str
+            the attribute to look up
+
+    Returns:
+        attribute: object
+            the submodule or the public object
+    """
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        module = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # cache on the package so __getattr__ is only hit once per name
+    globals()[name] = module
+    return module
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
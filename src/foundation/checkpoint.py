@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import glob
+import os
+import pickle
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+from .core import Vector
+
+if TYPE_CHECKING:
+    from .optimizers import Optimizer
+
+"""
+Asynchronous checkpointing of parameters and optimizer state during training.
+
+The training loop only pays for copying the parameter values and optimizer state
+into memory, a background thread serializes the snapshot and writes it to disk.
+"""
+
+PATTERN = "checkpoint-*.pkl"
+
+
+class Checkpointer:
+    def __init__(
+        self,
+        directory: str,
+        every_epochs: Optional[int] = None,
+        every_seconds: Optional[float] = None,
+        keep: int = 3,
+    ) -> None:
+        """
+        Periodic checkpointing with a background writer thread.
+
+        Only the most recent snapshot waits for the writer: if the disk is slower than
+        the training loop, older unwritten snapshots are replaced instead of queued.
+
+        Parameters:
+            directory: str
+                directory the checkpoints are written to
+            every_epochs: Optional[int]
+                save every n epochs
+            every_seconds: Optional[float]
+                save when at least this many seconds passed since the last save
+            keep: int
+                no of most recent checkpoints kept on disk
+
+        Returns:
+            None
+        """
+        assert keep > 0, f"keep ({keep}) must be positive"
+        self.directory = directory
+        self.every_epochs = every_epochs
+        self.every_seconds = every_seconds
+        self.keep = keep
+
+        self._last_save = time.monotonic()
+        self._pending: Optional[dict] = None
+        self._writing = False
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Starts the time interval, called by MLP.fit when training starts.
+
+        Returns:
+            None
+        """
+        self._last_save = time.monotonic()
+
+    def due(self, epoch: int) -> bool:
+        """
+        Whether a checkpoint is due after the given epoch.
+
+        Parameters:
+            epoch: int
+                the epoch that just finished
+
+        Returns:
+            due: bool
+                True if either the epoch or the time interval elapsed
+        """
+        if self.every_epochs is not None and (epoch + 1) % self.every_epochs == 0:
+            return True
+        if self.every_seconds is not None:
+            return time.monotonic() - self._last_save >= self.every_seconds
+        return False
+
+    def save(
+        self,
+        epoch: int,
+        parameters: Vector,
+        optimizer: Optimizer,
+        history: Optional[dict] = None,
+    ) -> None:
+        """
+        Snapshots the training state in memory and hands it to the writer thread.
+
+        Parameters:
+            epoch: int
+                the epoch that just finished
+            parameters: Vector
+                the parameters of the model
+            optimizer: Optimizer
+                the optimizer, its state() is stored
+            history: Optional[dict]
+                the learning history so far
+
+        Returns:
+            None
+        """
+        snapshot = {
+            "epoch": epoch,
+            "parameters": [param.data for param in parameters],
+            "optimizer": optimizer.state(),
+            "history": {key: list(values) for key, values in (history or {}).items()},
+        }
+        self._last_save = time.monotonic()
+
+        with self._condition:
+            self._raise_error()
+            assert not self._closed, "checkpointer is closed"
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._write_loop, name="foundation-checkpointer", daemon=True
+                )
+                self._thread.start()
+            self._pending = snapshot
+            self._condition.notify_all()
+
+    def flush(self) -> None:
+        """
+        Blocks until all snapshots handed to the writer are on disk.
+
+        Returns:
+            None
+        """
+        with self._condition:
+            while self._pending is not None or self._writing:
+                self._condition.wait()
+            self._raise_error()
+
+    def close(self) -> None:
+        """
+        Flushes pending snapshots and stops the writer thread.
+
+        Returns:
+            None
+        """
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+
+    def checkpoints(self) -> list[str]:
+        """
+        The checkpoints on disk, oldest first.
+
+        Returns:
+            paths: list[str]
+                paths of all checkpoint files in the directory
+        """
+        return sorted(glob.glob(os.path.join(self.directory, PATTERN)))
+
+    def latest(self) -> Optional[str]:
+        """
+        The most recent checkpoint on disk.
+
+        Returns:
+            path: Optional[str]
+                path of the latest checkpoint, None if there is none
+        """
+        checkpoints = self.checkpoints()
+        return checkpoints[-1] if checkpoints else None
+
+    def _raise_error(self) -> None:
+        """
+        Re-raises an exception of the writer thread in the training thread.
+        """
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("writing checkpoint failed") from error
+
+    def _write_loop(self) -> None:
+        """
+        Body of the writer thread.
+        """
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                snapshot, self._pending = self._pending, None
+                self._writing = True
+
+            try:
+                self._write(snapshot)
+            except BaseException as error:  # surfaced by the next save/flush
+                self._error = error
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _write(self, snapshot: dict) -> None:
+        """
+        Atomically writes a snapshot and removes checkpoints beyond `keep`.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"checkpoint-{snapshot['epoch']:08d}.pkl")
+        temporary = path + ".tmp"
+
+        with open(temporary, "wb") as file:
+            pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        # readers either see the previous or the complete new checkpoint
+        os.replace(temporary, path)
+
+        for old in self.checkpoints()[: -self.keep]:
+            os.remove(old)
+
+
+def load_checkpoint(path: str) -> dict:
+    """
+    Loads a checkpoint written by a Checkpointer.
+
+    Parameters:
+        path: str
+            path of the checkpoint file
+
+    Returns:
+        checkpoint: dict
+            epoch, parameters, optimizer state and history
+    """
+    with open(path, "rb") as file:
+        return pickle.load(file)
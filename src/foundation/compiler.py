@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+import math
+from operator import add
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Hashable, Optional, Sequence
+
+from .core import Scalar, Vector
+from .metrics import mean_squared_error
+
+if TYPE_CHECKING:
+    from .nn import MLP
+
+"""
+Compiles a traced Scalar graph into a specialised straight-line python function.
+
+Interpreting the graph calls one `_backward` closure per node after a topological
+sort on every step. The compiler walks the graph once, emits one line of python per
+node for the forward pass (and per edge for the backward pass), compiles it with
+`compile()` and caches the resulting function, so repeated evaluations only pay
+for plain float arithmetic.
+
+The kernels are plain python rather than NumPy code although numpy is a dependency:
+they are generated node by node from any Scalar graph, sparse layers included, and
+take the parameters as the list of floats the Scalars hold. Wide dense layers
+would run faster as NumPy matrix products, which this compiler does not generate.
+"""
+
+# generated kernels of the most recently used model architectures
+_KERNELS: OrderedDict[Hashable, Callable] = OrderedDict()
+MAX_KERNELS = 32
+
+# names available inside generated kernels
+_NAMESPACE = {"tanh": math.tanh, "exp": math.exp}
+
+
+def topological_order(outputs: Vector) -> Vector:
+    """
+    Iterative topological sort of all scalars reachable from the outputs.
+
+    Unlike Graph.build_topo this does not recurse, so it works on deep graphs.
+
+    Parameters:
+        outputs: Vector
+            the roots of the graph
+
+    Returns:
+        topo: Vector
+            all reachable scalars, children before parents
+    """
+    topo, visited = [], set()
+
+    for output in outputs:
+        stack = [(output, False)]
+        while stack:
+            value, expanded = stack.pop()
+            if expanded:
+                topo.append(value)
+            elif value not in visited:
+                visited.add(value)
+                stack.append((value, True))
+                stack.extend((child, False) for child in value.children)
+
+    return topo
+
+
+def generate_source(
+    outputs: Vector,
+    arguments: dict[str, Vector],
+    wrt: Optional[Sequence[str]] = None,
+    name: str = "kernel",
+) -> str:
+    """
+    Generates the python source of a kernel evaluating the graph.
+
+    Leaves listed in `arguments` become function arguments (e.g. `x[3]`), every
+    other leaf is treated as a constant and inlined with its current value. The
+    backward pass only accumulates gradients of leaves in the `wrt` groups.
+
+    Parameters:
+        outputs: Vector
+            the scalars to compute
+        arguments: dict[str, Vector]
+            named groups of leaf scalars passed to the kernel as lists of floats
+        wrt: Optional[Sequence[str]]
+            argument groups to differentiate with respect to, requires a single output;
+            if None only the forward pass is generated
+        name: str
+            the name of the generated function
+
+    Returns:
+        source: str
+            the python source of the kernel
+    """
+    if wrt is not None:
+        assert len(outputs) == 1, "backward kernels require a single output"
+
+    topo = topological_order(outputs)
+    variables: dict[Scalar, str] = {}
+    lines = [f"def {name}({', '.join(arguments)}):"]
+
+    for group, leaves in arguments.items():
+        for index, leaf in enumerate(leaves):
+            variables[leaf] = f"v{len(variables)}"
+            lines.append(f"    {variables[leaf]} = {group}[{index}]")
+
+    for value in topo:
+        if value in variables:
+            continue
+        if not value.children:
+            # constant, inline its current value
+            variables[value] = f"({value.data!r})"
+            continue
+
+        variables[value] = f"v{len(variables)}"
+        lines.append(
+            f"    {variables[value]} = {_forward_expression(value, variables)}"
+        )
+
+    if wrt is None:
+        lines.append(f"    return [{', '.join(variables[out] for out in outputs)}]")
+        return "\n".join(lines) + "\n"
+
+    # reverse pass, the first contribution to a gradient assigns, later ones accumulate
+    grads: dict[Scalar, str] = {outputs[0]: "1.0"}
+    targets = {leaf for group in wrt for leaf in arguments[group]}
+
+    for value in reversed(topo):
+        if value not in grads or not value.children:
+            continue
+
+        for child, local in _local_gradients(value, variables):
+            # constants and leaves of other groups, e.g. inputs, need no gradient
+            if not child.children and child not in targets:
+                continue
+            term = f"{local} * {grads[value]}"
+            if child in grads:
+                lines.append(f"    {grads[child]} += {term}")
+            else:
+                grads[child] = "g" + variables[child][1:]
+                lines.append(f"    {grads[child]} = {term}")
+
+    grad_lists = [
+        "[" + ", ".join(grads.get(leaf, "0.0") for leaf in arguments[group]) + "]"
+        for group in wrt
+    ]
+    lines.append(f"    return {variables[outputs[0]]}, ({', '.join(grad_lists)},)")
+    return "\n".join(lines) + "\n"
+
+
+def _forward_expression(value: Scalar, variables: dict[Scalar, str]) -> str:
+    """
+    The python expression computing a scalar from its children.
+    """
+    children = [variables[child] for child in value.children]
+    # children is a set, x * x has a single child
+    a, b = children[0], children[-1]
+
+    if value.operation == "+":
+        return f"{a} + {b}"
+    if value.operation == "*":
+        return f"{a} * {b}"
+    if value.operation == "tanh":
+        return f"tanh({a})"
+    if value.operation == "relu":
+        return f"0 if {a} < 0 else {a}"
+    if value.operation == "exp":
+        return f"exp({a})"
+    if value.operation.startswith("**"):
+        return f"{a} ** ({value.operation[2:]})"
+
+    raise ValueError(f"cannot compile operation {value.operation!r}")
+
+
+def _local_gradients(
+    value: Scalar, variables: dict[Scalar, str]
+) -> list[tuple[Scalar, str]]:
+    """
+    The local derivatives of a scalar with respect to each of its children.
+    """
+    out = variables[value]
+    children = list(value.children)
+    a = variables[children[0]]
+
+    if value.operation == "+":
+        if len(children) == 1:
+            return [(children[0], "2.0")]
+        return [(children[0], "1.0"), (children[1], "1.0")]
+    if value.operation == "*":
+        if len(children) == 1:
+            return [(children[0], f"2.0 * {a}")]
+        return [(children[0], variables[children[1]]), (children[1], a)]
+    if value.operation == "tanh":
+        return [(children[0], f"(1 - {out} * {out})")]
+    if value.operation == "relu":
+        return [(children[0], f"({a} > 0)")]
+    if value.operation == "exp":
+        return [(children[0], out)]
+    if value.operation.startswith("**"):
+        power = value.operation[2:]
+        return [(children[0], f"({power}) * {a} ** ({power} - 1)")]
+
+    raise ValueError(f"cannot compile operation {value.operation!r}")
+
+
+def compile_source(source: str, name: str = "kernel") -> Callable:
+    """
+    Compiles generated source into a function.
+
+    Parameters:
+        source: str
+            the python source of the kernel
+        name: str
+            the name of the function defined by the source
+
+    Returns:
+        kernel: Callable
+            the compiled function
+    """
+    namespace = dict(_NAMESPACE)
+    exec(compile(source, f"<foundation.compiler.{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def compile_graph(
+    outputs: Vector,
+    arguments: dict[str, Vector],
+    wrt: Optional[Sequence[str]] = None,
+) -> Callable:
+    """
+    Compiles the graph reachable from the outputs into a python function.
+
+    The kernel takes one list of floats per argument group. Without `wrt` it returns
+    the list of output values, otherwise `(output, (grads, ...))` with one list of
+    gradients per group in `wrt`.
+
+    Parameters:
+        outputs: Vector
+            the scalars to compute
+        arguments: dict[str, Vector]
+            named groups of leaf scalars passed to the kernel as lists of floats
+        wrt: Optional[Sequence[str]]
+            argument groups to differentiate with respect to
+
+    Returns:
+        kernel: Callable
+            the compiled function
+    """
+    return compile_source(
+        generate_source(outputs=outputs, arguments=arguments, wrt=wrt)
+    )
+
+
+def architecture(model: MLP) -> tuple[Hashable, ...]:
+    """
+    The architecture of a model, i.e. the signature of every layer.
+
+    Parameters:
+        model: MLP
+            the model
+
+    Returns:
+        signatures: tuple[Hashable, ...]
+            e.g. ((3, 4), (4, 4), (4, 1)) for dense layers
+    """
+    return tuple(layer.signature() for layer in model.layers)
+
+
+def _cached(key: Hashable, build: Callable[[], Callable]) -> Callable:
+    """
+    Looks up a kernel, building it on a miss and evicting the least recently used
+    kernel beyond MAX_KERNELS.
+    """
+    if key in _KERNELS:
+        _KERNELS.move_to_end(key)
+    else:
+        _KERNELS[key] = build()
+        if len(_KERNELS) > MAX_KERNELS:
+            _KERNELS.popitem(last=False)
+    return _KERNELS[key]
+
+
+def compile_forward(model: MLP) -> Callable[[list[float], list[float]], list[float]]:
+    """
+    Compiles the forward pass of a model, cached by architecture.
+
+    The kernel is called as `kernel(x, p)` with an input vector x and the values
+    of `model.parameters()` and returns the list of outputs.
+
+    Parameters:
+        model: MLP
+            the model to compile
+
+    Returns:
+        kernel: Callable[[list[float], list[float]], list[float]]
+            the compiled forward pass
+    """
+    signature = architecture(model)
+
+    def build() -> Callable:
+        x = [Scalar(data=0.0) for _ in range(signature[0][0])]
+        return compile_graph(
+            outputs=model(x), arguments={"x": x, "p": model.parameters()}
+        )
+
+    return _cached(("forward", signature), build)
+
+
+def compile_loss(
+    model: MLP,
+) -> Callable[
+    [list[list[float]], list[float], list[float]], tuple[float, tuple[list[float]]]
+]:
+    """
+    Compiles the mean squared error loss and its gradient, cached by architecture.
+
+    Only a single sample is traced and compiled, so the generated code and the
+    compile time do not grow with the batch size; the returned function runs the
+    sample kernel once per row and accumulates loss and gradients.
+
+    The function is called as `kernel(x, y, p)` with the batch x, the targets y and
+    the values of `model.parameters()` and returns `(loss, (grads,))` with the
+    gradient of every parameter.
+
+    Parameters:
+        model: MLP
+            the model to compile
+
+    Returns:
+        kernel: Callable
+            the compiled forward and backward pass
+    """
+    signature = architecture(model)
+
+    def build() -> Callable:
+        x = [Scalar(data=0.0) for _ in range(signature[0][0])]
+        y = [Scalar(data=0.0)]
+        sample = compile_graph(
+            outputs=[mean_squared_error(y, [model(x)])],
+            arguments={"x": x, "y": y, "p": model.parameters()},
+            wrt=("p",),
+        )
+
+        def kernel(
+            x: list[list[float]], y: list[float], p: list[float]
+        ) -> tuple[float, tuple[list[float]]]:
+            loss, grads = 0.0, [0.0] * len(p)
+            for x_i, y_i in zip(x, y):
+                sample_loss, (sample_grads,) = sample(x_i, (y_i,), p)
+                loss += sample_loss
+                grads = list(map(add, grads, sample_grads))
+            return loss, (grads,)
+
+        return kernel
+
+    return _cached(("loss", signature), build)
@@ -8,7 +8,20 @@ Inspired by https://github.com/karpathy/micrograd/tree/master/micrograd
 """
 
 
+def _no_backward() -> None:
+    """
+    Backward function of leaf scalars, shared instead of one lambda per scalar.
+    """
+
+
+# children of all leaves, shared instead of one empty set per scalar; building a
+# model allocates a scalar per weight and each set is one more object for the gc
+_NO_CHILDREN: frozenset = frozenset()
+
+
 class Scalar:
+    __slots__ = ("data", "grad", "_backward", "children", "operation", "label")
+
     def __init__(
         self,
         data: float,
@@ -34,8 +47,8 @@ class Scalar:
         """
         self.data = data
         self.grad = 0.0  # derivative of itself with respect to the loss function
-        self._backward: Callable = lambda: None
-        self.children = set(children)
+        self._backward: Callable = _no_backward
+        self.children = set(children) if children else _NO_CHILDREN
         self.operation = operation
         self.label = label
 
@@ -296,3 +309,192 @@ class Graph:
             for child in value.children:
                 self.build_topo(child)
             self.topo.append(value)
+
+
+class Dual:
+    __slots__ = ("data", "tangent")
+
+    def __init__(self, data: float, tangent: float = 0.0) -> None:
+        """
+        A dual number a + b*eps (eps**2 == 0) for forward-mode differentiation.
+
+        Unlike Scalar, a Dual carries its derivative along with its value and
+        builds no graph, so memory stays constant regardless of the computation.
+
+        Parameters:
+            data: float
+                the value of the dual number
+            tangent: float
+                the directional derivative carried along with the value
+
+        Returns:
+            None
+        """
+        self.data = data
+        self.tangent = tangent
+
+    def __repr__(self) -> str:
+        """
+        Representation of the dual number.
+
+        Returns:
+             representation: str
+                the string representation of the dual number
+        """
+        return f"Dual(data={self.data}, tangent={self.tangent})"
+
+    def __add__(self, other: Union[Dual, int, float]) -> Dual:
+        """
+        Add operation to add a dual number to another dual number.
+
+        Parameters:
+            other: Union[Dual, int, float]
+                the dual number to add
+
+        Returns:
+            out: Dual
+                the result of the addition
+        """
+        if isinstance(other, Dual):
+            return Dual(
+                data=self.data + other.data, tangent=self.tangent + other.tangent
+            )
+        return Dual(data=self.data + other, tangent=self.tangent)
+
+    def __radd__(self, other: Union[int, float]) -> Dual:
+        """
+        Fallback for addition of a number and a dual number.
+
+        Parameters:
+            other: Union[int, float]
+                the number to add
+
+        Returns:
+            out: Dual
+                the result of the addition
+        """
+        return self + other
+
+    def __mul__(self, other: Union[Dual, int, float]) -> Dual:
+        """
+        Multiply operation to multiply a dual number with another dual number.
+
+        Parameters:
+            other: Union[Dual, int, float]
+                the dual number to multiply with
+
+        Returns:
+            out: Dual
+                the result of the multiplication
+        """
+        if isinstance(other, Dual):
+            return Dual(
+                data=self.data * other.data,
+                tangent=self.tangent * other.data + self.data * other.tangent,
+            )
+        return Dual(data=self.data * other, tangent=self.tangent * other)
+
+    def __rmul__(self, other: Union[int, float]) -> Dual:
+        """
+        Fallback for multiplication of a number and a dual number.
+
+        Parameters:
+            other: Union[int, float]
+                the number to multiply with
+
+        Returns:
+            out: Dual
+                the result of the multiplication
+        """
+        return self * other
+
+    def __pow__(self, other: Union[int, float]) -> Dual:
+        """
+        Power operation to raise a dual number to a constant power.
+
+        Parameters:
+            other: Union[int, float]
+                the exponent
+
+        Returns:
+            out: Dual
+                the result of the power operation
+        """
+        return Dual(
+            data=self.data**other,
+            tangent=other * self.data ** (other - 1) * self.tangent,
+        )
+
+    def __neg__(self) -> Dual:
+        """
+        Negation operation to negate a dual number.
+
+        Returns:
+            out: Dual
+                the result of the negation operation
+        """
+        return Dual(data=-self.data, tangent=-self.tangent)
+
+    def __sub__(self, other: Union[Dual, int, float]) -> Dual:
+        """
+        Subtract operation to subtract a dual number from another dual number.
+
+        Parameters:
+            other: Union[Dual, int, float]
+                the dual number to subtract
+
+        Returns:
+            out: Dual
+                the result of the subtraction
+        """
+        return self + -other
+
+    def __truediv__(self, other: Union[Dual, int, float]) -> Dual:
+        """
+        Divide operation to divide a dual number by another dual number.
+
+        Parameters:
+            other: Union[Dual, int, float]
+                the dual number to divide by
+
+        Returns:
+            out: Dual
+                the result of the division
+        """
+        if isinstance(other, Dual):
+            return self * other**-1
+        return Dual(data=self.data / other, tangent=self.tangent / other)
+
+    def tanh(self) -> Dual:
+        """
+        Hyperbolic tangent operation.
+
+        Returns:
+            out: Dual
+                the result of the hyperbolic tangent operation
+        """
+        tanh = math.tanh(self.data)
+        return Dual(data=tanh, tangent=(1 - tanh**2) * self.tangent)
+
+    def relu(self) -> Dual:
+        """
+        Rectified linear unit operation.
+
+        Returns:
+            out: Dual
+                the result of the rectified linear unit operation
+        """
+        if self.data > 0:
+            return Dual(data=self.data, tangent=self.tangent)
+        return Dual(data=0, tangent=0.0)
+
+    def exp(self) -> Dual:
+        """
+        Exponential operation.
+
+        Returns:
+            out: Dual
+                the result of the exponential operation
+        """
+        exp = math.exp(self.data)
+        return Dual(data=exp, tangent=exp * self.tangent)
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from typing import Union
+
+import numpy as np
+
+from .initializers import INITIALIZERS, Seed, generator
+from .nn import MLP, Layer
+
+"""
+Trains many small MLPs of the same architecture at once.
+
+The parameters of K models are stacked along a leading axis, so forward pass,
+backward pass and SGD step of the whole ensemble are a handful of batched numpy
+operations per layer instead of K interpreted Scalar graphs.
+"""
+
+
+class Ensemble:
+    def __init__(self, weights: list[np.ndarray], biases: list[np.ndarray]) -> None:
+        """
+        Stack of K MLPs sharing one architecture, created by make_ensemble() or stack().
+
+        Parameters:
+            weights: list[np.ndarray]
+                per layer the stacked weights of shape (K, no_outputs, no_inputs)
+            biases: list[np.ndarray]
+                per layer the stacked biases of shape (K, no_outputs)
+
+        Returns:
+            None
+        """
+        self.weights = weights
+        self.biases = biases
+
+    def __len__(self) -> int:
+        """
+        The number of models K.
+
+        Returns:
+            size: int
+                no of stacked models
+        """
+        return self.weights[0].shape[0]
+
+    def __repr__(self) -> str:
+        """
+        Representation of the ensemble.
+
+        Returns:
+            representation: str
+                the string representation of the ensemble
+        """
+        sizes = [self.weights[0].shape[2]] + [w.shape[1] for w in self.weights]
+        return f"Ensemble of {len(self)} MLPs {sizes}"
+
+    def forward(self, x: Union[list[list[float]], np.ndarray]) -> list[np.ndarray]:
+        """
+        Forward pass of all models, keeping the activations for the backward pass.
+
+        Parameters:
+            x: Union[list[list[float]], np.ndarray]
+                input vectors of shape (batch, no_inputs), shared by all models
+
+        Returns:
+            activations: list[np.ndarray]
+                the inputs followed by the output of every layer, shape (K, batch, n)
+        """
+        out = np.broadcast_to(
+            np.asarray(x, dtype=np.float64), (len(self),) + np.shape(x)
+        )
+        activations = [out]
+
+        for weights, biases in zip(self.weights, self.biases):
+            out = np.tanh(out @ weights.transpose(0, 2, 1) + biases[:, None, :])
+            activations.append(out)
+
+        return activations
+
+    def predict(self, x: Union[list[list[float]], np.ndarray]) -> np.ndarray:
+        """
+        Outputs of all models.
+
+        Parameters:
+            x: Union[list[list[float]], np.ndarray]
+                input vectors of shape (batch, no_inputs)
+
+        Returns:
+            out: np.ndarray
+                outputs of shape (K, batch, no_outputs)
+        """
+        return self.forward(x)[-1]
+
+    def fit(
+        self,
+        x: list[list[float]],
+        y: list[float],
+        learning_rates: Union[float, list[float]],
+        epochs: int,
+    ) -> list[dict]:
+        """
+        Full-batch gradient descent of all models at once, see MLP.fit.
+
+        Parameters
+            x: list[list[float]]
+                the input values to be fitted
+            y: list[float]
+                the expected target values (labels)
+            learning_rates: Union[float, list[float]]
+                one learning rate shared by all models or one per model
+            epochs: int
+                no of epochs (full x iterations)
+
+        Returns
+            histories: list[dict]
+                the learning history containing loss, one per model
+        """
+        learning_rates = np.broadcast_to(
+            np.asarray(learning_rates, float), (len(self),)
+        )
+        y = np.asarray(y, dtype=np.float64)
+        losses = np.empty((epochs, len(self)))
+
+        for i in range(epochs):
+            # forward pass
+            activations = self.forward(x)
+
+            # mse loss on the first output, as metrics.mean_squared_error
+            error = activations[-1][:, :, 0] - y
+            losses[i] = np.sum(error**2, axis=1)
+
+            print(f"epoch {i} loss: min {losses[i].min()} max {losses[i].max()}")
+
+            # backward pass
+            grad = np.zeros_like(activations[-1])
+            grad[:, :, 0] = 2 * error
+
+            for layer in reversed(range(len(self.weights))):
+                out, inputs = activations[layer + 1], activations[layer]
+                # through the tanh non-linearity
+                grad = grad * (1 - out**2)
+                weights_grad = grad.transpose(0, 2, 1) @ inputs
+                biases_grad = grad.sum(axis=1)
+                if layer > 0:
+                    grad = grad @ self.weights[layer]
+
+                # sgd update of weights and biases with per model learning rates
+                self.weights[layer] -= learning_rates[:, None, None] * weights_grad
+                self.biases[layer] -= learning_rates[:, None] * biases_grad
+
+        return [{"loss": losses[:, k].tolist()} for k in range(len(self))]
+
+    def unstack(self) -> list[MLP]:
+        """
+        Unstacks the ensemble into independent MLPs.
+
+        Returns:
+            models: list[MLP]
+                one model per stacked set of parameters
+        """
+        sizes = [w.shape[1] for w in self.weights]
+        models = []
+
+        for k in range(len(self)):
+            model = MLP(no_inputs=self.weights[0].shape[2], no_layer_outputs=sizes)
+            for layer, weights, biases in zip(model.layers, self.weights, self.biases):
+                for neuron, w_row, bias in zip(layer.neurons, weights[k], biases[k]):
+                    for w_i, value in zip(neuron.w, w_row.tolist()):
+                        w_i.data = value
+                    neuron.b.data = float(bias)
+            models.append(model)
+
+        return models
+
+
+def make_ensemble(
+    no_inputs: int,
+    no_layer_outputs: list[int],
+    seeds: list[Seed],
+    init: str = "uniform",
+) -> Ensemble:
+    """
+    Initializes an ensemble of K models, one per seed.
+
+    Model k starts from the same parameters as
+    MLP(no_inputs, no_layer_outputs, init=init, seed=seeds[k]).
+
+    Parameters:
+        no_inputs: int
+            no of inputs x into a neuron
+        no_layer_outputs: list[int]
+            list of no of neurons per layer
+        seeds: list[Seed]
+            one seed per model
+        init: str
+            initialization scheme, one of "uniform", "xavier" or "he"
+
+    Returns:
+        ensemble: Ensemble
+            the stacked models
+    """
+    if init not in INITIALIZERS:
+        raise ValueError(
+            f"unknown initialization scheme {init!r}, use one of {list(INITIALIZERS)}"
+        )
+
+    sizes = [no_inputs] + no_layer_outputs
+    rngs = [generator(seed) for seed in seeds]
+    weights, biases = [], []
+
+    for i in range(len(no_layer_outputs)):
+        buffers = np.stack(
+            [INITIALIZERS[init](rng, sizes[i], sizes[i + 1]) for rng in rngs]
+        )
+        weights.append(np.ascontiguousarray(buffers[:, :, :-1]))
+        biases.append(np.ascontiguousarray(buffers[:, :, -1]))
+
+    return Ensemble(weights=weights, biases=biases)
+
+
+def stack(models: list[MLP]) -> Ensemble:
+    """
+    Stacks the parameters of existing models with the same dense architecture.
+
+    Parameters:
+        models: list[MLP]
+            the models to stack
+
+    Returns:
+        ensemble: Ensemble
+            the stacked models
+    """
+    assert all(
+        isinstance(layer, Layer) for model in models for layer in model.layers
+    ), "only models with dense layers can be stacked"
+    assert (
+        len({tuple(layer.signature() for layer in model.layers) for model in models})
+        == 1
+    ), "all models must have the same architecture"
+
+    weights = [
+        np.array([[[w.data for w in n.w] for n in m.layers[i].neurons] for m in models])
+        for i in range(len(models[0].layers))
+    ]
+    biases = [
+        np.array([[n.b.data for n in m.layers[i].neurons] for m in models])
+        for i in range(len(models[0].layers))
+    ]
+
+    return Ensemble(weights=weights, biases=biases)
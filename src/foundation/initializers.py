@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import math
+from typing import Callable, Union
+
+import numpy as np
+
+"""
+Vectorized parameter initialization.
+
+Each scheme draws all weights of a layer with a single call to a numpy Generator
+into one contiguous buffer, which is then handed to the neurons row by row.
+
+Only the drawing is vectorized: the neurons still wrap every weight into its own
+Scalar, so building a model stays linear in the no of parameters with one object
+per weight, it just no longer pays for one random.uniform call per weight.
+"""
+
+Seed = Union[np.random.Generator, int, None]
+
+
+def uniform(rng: np.random.Generator, no_inputs: int, no_outputs: int) -> np.ndarray:
+    """
+    Uniform initialization in [-1, 1) of weights and biases.
+
+    Parameters:
+        rng: np.random.Generator
+            the random number generator
+        no_inputs: int
+            no of inputs into a neuron (fan in)
+        no_outputs: int
+            no of neurons (fan out)
+
+    Returns:
+        buffer: np.ndarray
+            weights and bias of every neuron, shape (no_outputs, no_inputs + 1)
+    """
+    return rng.uniform(-1, 1, size=(no_outputs, no_inputs + 1))
+
+
+def xavier(rng: np.random.Generator, no_inputs: int, no_outputs: int) -> np.ndarray:
+    """
+    Xavier/Glorot uniform initialization of weights, suited for tanh; biases are zero.
+
+    Parameters:
+        rng: np.random.Generator
+            the random number generator
+        no_inputs: int
+            no of inputs into a neuron (fan in)
+        no_outputs: int
+            no of neurons (fan out)
+
+    Returns:
+        buffer: np.ndarray
+            weights and bias of every neuron, shape (no_outputs, no_inputs + 1)
+    """
+    limit = math.sqrt(6 / (no_inputs + no_outputs))
+    buffer = np.zeros((no_outputs, no_inputs + 1))
+    buffer[:, :no_inputs] = rng.uniform(-limit, limit, size=(no_outputs, no_inputs))
+    return buffer
+
+
+def he(rng: np.random.Generator, no_inputs: int, no_outputs: int) -> np.ndarray:
+    """
+    He/Kaiming normal initialization of weights, suited for relu; biases are zero.
+
+    Parameters:
+        rng: np.random.Generator
+            the random number generator
+        no_inputs: int
+            no of inputs into a neuron (fan in)
+        no_outputs: int
+            no of neurons (fan out)
+
+    Returns:
+        buffer: np.ndarray
+            weights and bias of every neuron, shape (no_outputs, no_inputs + 1)
+    """
+    buffer = np.zeros((no_outputs, no_inputs + 1))
+    buffer[:, :no_inputs] = rng.normal(
+        0.0, math.sqrt(2 / no_inputs), size=(no_outputs, no_inputs)
+    )
+    return buffer
+
+
+INITIALIZERS: dict[str, Callable[[np.random.Generator, int, int], np.ndarray]] = {
+    "uniform": uniform,
+    "xavier": xavier,
+    "he": he,
+}
+
+
+def generator(seed: Seed = None) -> np.random.Generator:
+    """
+    Creates a random number generator.
+
+    Parameters:
+        seed: Seed
+            a seed, an existing generator (returned as is) or None for fresh entropy
+
+    Returns:
+        rng: np.random.Generator
+            the random number generator
+    """
+    return np.random.default_rng(seed)
+
+
+def initialize(
+    no_inputs: int, no_outputs: int, scheme: str = "uniform", rng: Seed = None
+) -> list[list[float]]:
+    """
+    Draws the weights and biases of a layer.
+
+    Parameters:
+        no_inputs: int
+            no of inputs into a neuron
+        no_outputs: int
+            no of neurons
+        scheme: str
+            one of "uniform", "xavier" or "he"
+        rng: Seed
+            the random number generator or a seed
+
+    Returns:
+        rows: list[list[float]]
+            per neuron its no_inputs weights followed by its bias
+    """
+    if scheme not in INITIALIZERS:
+        raise ValueError(
+            f"unknown initialization scheme {scheme!r}, use one of {list(INITIALIZERS)}"
+        )
+
+    return INITIALIZERS[scheme](generator(rng), no_inputs, no_outputs).tolist()
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import gc
+import sys
+from collections import Counter
+from typing import TYPE_CHECKING, Optional, Union
+
+from .compiler import topological_order
+from .core import Scalar, Vector
+from .metrics import mean_squared_error
+
+if TYPE_CHECKING:
+    from .nn import MLP
+
+"""
+Size and memory introspection of Scalar graphs.
+
+All traversals are iterative, so they also work on graphs far deeper than the
+recursion limit.
+"""
+
+
+class GraphStats:
+    def __init__(
+        self,
+        nodes: int,
+        operations: dict[str, int],
+        depth: int,
+        closures: int,
+        leaves: int,
+        parameters: int,
+        constants: int,
+        nbytes: int,
+    ) -> None:
+        """
+        Size statistics of a Scalar graph, created by graph_stats().
+
+        Parameters:
+            nodes: int
+                no of scalars in the graph
+            operations: dict[str, int]
+                no of scalars per operation, leaves excluded
+            depth: int
+                no of scalars on the longest path from an output to a leaf
+            closures: int
+                no of _backward closures retained by the graph
+            leaves: int
+                no of scalars without children
+            parameters: int
+                no of leaves that are parameters
+            constants: int
+                no of leaves that are no parameters, i.e. numbers wrapped into a
+                Scalar by __add__/__mul__ (inputs included)
+            nbytes: int
+                estimated bytes retained by scalars, children sets and closures
+
+        Returns:
+            None
+        """
+        self.nodes = nodes
+        self.operations = operations
+        self.depth = depth
+        self.closures = closures
+        self.leaves = leaves
+        self.parameters = parameters
+        self.constants = constants
+        self.nbytes = nbytes
+
+    def __repr__(self) -> str:
+        """
+        Representation of the statistics.
+
+        Returns:
+            representation: str
+                the string representation of the statistics
+        """
+        return (
+            f"GraphStats(nodes={self.nodes}, depth={self.depth}, "
+            f"closures={self.closures}, constants={self.constants}, "
+            f"nbytes={self.nbytes})"
+        )
+
+    def summary(self) -> None:
+        """
+        Prints a summary of the graph.
+
+        Returns:
+            None
+        """
+        print("===== Graph Summary =====")
+        for operation, count in sorted(self.operations.items()):
+            print(f"{operation}: {count} nodes")
+        print(
+            f"leaves: {self.leaves} ({self.parameters} parameters, {self.constants} constants)"
+        )
+        print("=========================")
+        print(
+            f"Total nodes: {self.nodes}, depth: {self.depth}, closures: {self.closures}"
+        )
+        print(f"Estimated memory: {self.nbytes / 1024:.1f} KiB")
+
+
+def _nbytes(value: Scalar) -> int:
+    """
+    Estimated bytes retained by a single scalar.
+    """
+    size = sys.getsizeof(value) + sys.getsizeof(value.children)
+    size += sys.getsizeof(value.data) + sys.getsizeof(value.grad)
+
+    # leaves share one plain function, operations hold a closure over their operands
+    for cell in value._backward.__closure__ or ():
+        size += sys.getsizeof(cell)
+    if value._backward.__closure__:
+        size += sys.getsizeof(value._backward)
+
+    return size
+
+
+def graph_stats(
+    outputs: Union[Scalar, Vector], parameters: Optional[Vector] = None
+) -> GraphStats:
+    """
+    Computes the size statistics of the graph reachable from the outputs.
+
+    Parameters:
+        outputs: Union[Scalar, Vector]
+            the root, e.g. a loss, or several outputs
+        parameters: Optional[Vector]
+            the parameters of the model, to tell them apart from wrapped constants
+
+    Returns:
+        stats: GraphStats
+            the statistics of the graph
+    """
+    outputs = [outputs] if isinstance(outputs, Scalar) else outputs
+    parameters = set(parameters or ())
+
+    topo = topological_order(outputs)
+    operations: Counter = Counter()
+    depths: dict[Scalar, int] = {}
+    closures = leaves = no_parameters = nbytes = 0
+
+    for value in topo:
+        # children come first in topological order
+        depths[value] = 1 + max((depths[child] for child in value.children), default=0)
+        nbytes += _nbytes(value)
+
+        if value._backward.__closure__:
+            closures += 1
+        if value.children:
+            operations[value.operation] += 1
+        else:
+            leaves += 1
+            no_parameters += value in parameters
+
+    return GraphStats(
+        nodes=len(topo),
+        operations=dict(operations),
+        depth=max((depths[output] for output in outputs), default=0),
+        closures=closures,
+        leaves=leaves,
+        parameters=no_parameters,
+        constants=leaves - no_parameters,
+        nbytes=nbytes,
+    )
+
+
+def model_graph_stats(
+    model: MLP, x: list[list[float]], y: Optional[list[float]] = None
+) -> GraphStats:
+    """
+    Computes the size statistics of the graph a model builds for a batch.
+
+    Parameters:
+        model: MLP
+            the model
+        x: list[list[float]]
+            the batch of inputs
+        y: Optional[list[float]]
+            the targets; if given the graph of the mean squared error loss is measured,
+            otherwise the graph of the outputs
+
+    Returns:
+        stats: GraphStats
+            the statistics of the graph
+    """
+    y_preds = model.forward(x)
+
+    if y is not None:
+        return graph_stats(mean_squared_error(y, y_preds), model.parameters())
+    return graph_stats(
+        [out for y_pred in y_preds for out in y_pred], model.parameters()
+    )
+
+
+def live_scalars() -> int:
+    """
+    Counts the scalars still reachable in the interpreter.
+
+    Graphs form reference cycles through their _backward closures, so they are only
+    freed by the cyclic garbage collector, which is run first to not count garbage.
+    A count growing across epochs means graphs are kept alive, e.g. by storing
+    losses instead of loss.data.
+
+    Returns:
+        count: int
+            no of reachable Scalar objects
+    """
+    gc.collect()
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, Scalar))
+
+
+class GraphMonitor:
+    def __init__(self, track_live: bool = False) -> None:
+        """
+        Records graph statistics across epochs, pass it to MLP.fit(monitor=...).
+
+        Parameters:
+            track_live: bool
+                also count the live scalars after every record (slow, runs the
+                garbage collector and scans all objects it tracks)
+
+        Returns:
+            None
+        """
+        self.track_live = track_live
+        self.history: list[GraphStats] = []
+        self.live: list[int] = []
+
+    def record(
+        self, outputs: Union[Scalar, Vector], parameters: Optional[Vector] = None
+    ) -> GraphStats:
+        """
+        Records the statistics of a graph.
+
+        Parameters:
+            outputs: Union[Scalar, Vector]
+                the root, e.g. the loss of an epoch
+            parameters: Optional[Vector]
+                the parameters of the model
+
+        Returns:
+            stats: GraphStats
+                the recorded statistics
+        """
+        stats = graph_stats(outputs=outputs, parameters=parameters)
+        self.history.append(stats)
+        if self.track_live:
+            self.live.append(live_scalars())
+        return stats
+
+    def growth(self) -> dict[str, int]:
+        """
+        Change between the first and the last record, non-zero values hint at a leak.
+
+        Returns:
+            growth: dict[str, int]
+                difference of nodes, bytes, constants and (if tracked) live scalars
+        """
+        if len(self.history) < 2:
+            return {}
+
+        first, last = self.history[0], self.history[-1]
+        growth = {
+            "nodes": last.nodes - first.nodes,
+            "nbytes": last.nbytes - first.nbytes,
+            "constants": last.constants - first.constants,
+        }
+        if self.live:
+            growth["live_scalars"] = self.live[-1] - self.live[0]
+        return growth
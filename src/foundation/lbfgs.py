@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+import numpy as np
+
+from .optimizers import Optimizer
+
+"""
+Limited-memory BFGS, a quasi-Newton optimizer for small full-batch problems.
+
+Kept apart from optimizers.py, so that SGD does not pull in numpy.
+"""
+
+
+class LBFGS(Optimizer):
+
+    requires_closure = True
+
+    def __init__(
+        self,
+        learning_rate: float = 1.0,
+        history_size: int = 10,
+        max_line_search: int = 20,
+        tolerance: float = 1e-10,
+    ) -> None:
+        """
+        Limited-memory BFGS with a backtracking (Armijo) line search.
+
+        Works on a flattened view of all parameters and their gradients. The last
+        `history_size` position and gradient differences are kept in fixed-size
+        ring buffers to approximate the inverse Hessian.
+
+        Parameters:
+            learning_rate: float
+                the initial step size tried by the line search
+            history_size: int
+                no of correction pairs kept
+            max_line_search: int
+                max no of loss evaluations per line search
+            tolerance: float
+                no step is taken once the largest absolute gradient is below this
+
+        Returns:
+            None
+        """
+        super().__init__(learning_rate=learning_rate)
+        self.history_size = history_size
+        self.max_line_search = max_line_search
+        self.tolerance = tolerance
+        self.s: Optional[np.ndarray] = None  # position differences
+        self.y: Optional[np.ndarray] = None  # gradient differences
+        self.rho = np.zeros(history_size)
+        self.head = 0  # index of the next slot to write
+        self.size = 0  # no of valid correction pairs
+        # closure, position, loss and gradient of the last evaluation
+        self._last: Optional[
+            tuple[Callable[[], float], np.ndarray, float, np.ndarray]
+        ] = None
+
+    def state(self) -> dict:
+        """
+        A copy of the optimizer state including the correction pairs.
+
+        Returns:
+            state: dict
+                the hyperparameters and ring buffers of the optimizer
+        """
+        return {
+            **super().state(),
+            "s": None if self.s is None else self.s.copy(),
+            "y": None if self.y is None else self.y.copy(),
+            "rho": self.rho.copy(),
+            "head": self.head,
+            "size": self.size,
+        }
+
+    def load_state(self, state: dict) -> None:
+        """
+        Restores the optimizer state returned by state().
+
+        Parameters:
+            state: dict
+                the state to restore
+
+        Returns:
+            None
+        """
+        super().load_state(state)
+        self.s = None if state["s"] is None else state["s"].copy()
+        self.y = None if state["y"] is None else state["y"].copy()
+        self.rho = state["rho"].copy()
+        self.head = state["head"]
+        self.size = state["size"]
+        self._last = None
+
+    def flat_data(self) -> np.ndarray:
+        """
+        The values of all parameters as one vector.
+
+        Returns:
+            data: np.ndarray
+                flattened parameter values
+        """
+        return np.fromiter(
+            (p.data for p in self.parameters), float, len(self.parameters)
+        )
+
+    def flat_grad(self) -> np.ndarray:
+        """
+        The gradients of all parameters as one vector.
+
+        Returns:
+            grad: np.ndarray
+                flattened parameter gradients
+        """
+        return np.fromiter(
+            (p.grad for p in self.parameters), float, len(self.parameters)
+        )
+
+    def set_data(self, data: np.ndarray) -> None:
+        """
+        Writes a flat vector back into the parameters.
+
+        Parameters:
+            data: np.ndarray
+                flattened parameter values
+
+        Returns:
+            None
+        """
+        for param, value in zip(self.parameters, data.tolist()):
+            param.data = value
+
+    def evaluate(
+        self, closure: Callable[[], float], data: np.ndarray
+    ) -> tuple[float, np.ndarray]:
+        """
+        Loss and flat gradient at the given position.
+
+        Parameters:
+            closure: Callable[[], float]
+                re-evaluates the model and returns the loss
+            data: np.ndarray
+                flattened parameter values to evaluate at
+
+        Returns:
+            loss, grad: tuple[float, np.ndarray]
+                the loss and its flattened gradient
+        """
+        self.set_data(data)
+        loss = closure()
+        grad = self.flat_grad()
+        self._last = (closure, data, loss, grad)
+        return loss, grad
+
+    def direction(self, grad: np.ndarray) -> np.ndarray:
+        """
+        Two-loop recursion: approximates -H^-1 @ grad from the correction pairs.
+
+        Parameters:
+            grad: np.ndarray
+                the flattened gradient
+
+        Returns:
+            direction: np.ndarray
+                the search direction
+        """
+        q = grad.copy()
+        # newest to oldest slot of the ring buffers
+        slots = [(self.head - 1 - i) % self.history_size for i in range(self.size)]
+        alphas = []
+
+        for slot in slots:
+            alpha = self.rho[slot] * (self.s[slot] @ q)
+            q -= alpha * self.y[slot]
+            alphas.append(alpha)
+
+        if self.size:
+            newest = slots[0]
+            q *= (self.s[newest] @ self.y[newest]) / (self.y[newest] @ self.y[newest])
+
+        for slot, alpha in zip(reversed(slots), reversed(alphas)):
+            beta = self.rho[slot] * (self.y[slot] @ q)
+            q += (alpha - beta) * self.s[slot]
+
+        return -q
+
+    def step(self, closure: Optional[Callable[[], float]] = None) -> Optional[float]:
+        """
+        Performs a single L-BFGS iteration.
+
+        Parameters:
+            closure: Callable[[], float]
+                re-evaluates the model: zeroes the gradients, computes the loss,
+                runs the backward pass and returns the loss; required for the line search
+
+        Returns:
+            loss: Optional[float]
+                the loss before the step
+        """
+        assert closure is not None, "LBFGS requires a closure to re-evaluate the loss"
+
+        if self.s is None or self.s.shape[1] != len(self.parameters):
+            self.s = np.zeros((self.history_size, len(self.parameters)))
+            self.y = np.zeros((self.history_size, len(self.parameters)))
+            self.head = self.size = 0
+
+        data = self.flat_data()
+        if (
+            self._last is not None
+            and self._last[0] is closure
+            and np.array_equal(self._last[1], data)
+        ):
+            # the last line search already evaluated this position on the same batch
+            _, _, loss, grad = self._last
+        else:
+            loss = closure()
+            grad = self.flat_grad()
+
+        if np.max(np.abs(grad)) <= self.tolerance:
+            return loss
+
+        direction = self.direction(grad)
+        slope = grad @ direction
+        if slope >= 0:
+            # not a descent direction, restart from steepest descent
+            self.size = 0
+            direction, slope = -grad, -(grad @ grad)
+
+        step_size = self.lr
+        if not self.size:
+            # no curvature information yet, keep the first step at most lr long
+            step_size *= min(1.0, 1.0 / np.sum(np.abs(grad)))
+
+        for _ in range(self.max_line_search):
+            new_loss, new_grad = self.evaluate(closure, data + step_size * direction)
+            if new_loss <= loss + 1e-4 * step_size * slope:
+                break
+            step_size *= 0.5
+        else:
+            # no sufficient decrease found, stay put and forget the history
+            self.set_data(data)
+            self._last = None
+            self.size = 0
+            return loss
+
+        s = step_size * direction
+        y = new_grad - grad
+        sy = s @ y
+        if sy > 1e-10:
+            # curvature condition holds, store the correction pair
+            self.s[self.head], self.y[self.head] = s, y
+            self.rho[self.head] = 1.0 / sy
+            self.head = (self.head + 1) % self.history_size
+            self.size = min(self.size + 1, self.history_size)
+
+        return loss
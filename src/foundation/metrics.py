@@ -1,4 +1,4 @@
-from src.foundation.core import Scalar, Vector
+from .core import Scalar, Vector
 
 
 def mean_squared_error(y_true: list[float], y_preds: list[Vector]) -> Scalar:
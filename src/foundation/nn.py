@@ -1,8 +1,17 @@
-import random
+from __future__ import annotations
 
-from src.foundation.core import Scalar, Vector
-from src.foundation.metrics import mean_squared_error
-from src.foundation.optimizers import Optimizer
+import warnings
+from typing import TYPE_CHECKING, Callable, Hashable, Optional
+
+from .compiler import compile_forward, compile_loss
+from .core import Dual, Scalar, Vector
+from .initializers import Seed, generator, initialize
+from .metrics import mean_squared_error
+
+if TYPE_CHECKING:
+    from .checkpoint import Checkpointer
+    from .introspection import GraphMonitor
+    from .optimizers import Optimizer
 
 """
 Inspired by https://github.com/karpathy/micrograd/tree/master/micrograd
@@ -26,21 +35,42 @@ class Module:
 
 
 class Neuron(Module):
-    def __init__(self, no_inputs: int) -> None:
+    def __init__(
+        self,
+        no_inputs: int,
+        weights: Optional[list[float]] = None,
+        bias: Optional[float] = None,
+        rng: Seed = None,
+    ) -> None:
         """
         The single neuron computation unit
 
         Parameters:
             no_inputs: int
                 number of inputs x into a neuron
+            weights: Optional[list[float]]
+                initial weights, drawn uniformly from [-1, 1] if None
+            bias: Optional[float]
+                initial bias, drawn uniformly from [-1, 1] if None
+            rng: Seed
+                numpy random number generator or seed for the drawn values,
+                random.seed() does not affect them
 
         Returns:
             None
         """
-        # random initialization of weights for all inputs x_0...x_no_inputs
-        self.w = [Scalar(data=random.uniform(-1, 1)) for _ in range(no_inputs)]
+        if weights is None or bias is None:
+            # random initialization of weights for all inputs x_0...x_no_inputs and bias
+            row = initialize(no_inputs, 1, rng=rng)[0]
+            weights = row[:-1] if weights is None else weights
+            bias = row[-1] if bias is None else bias
+        assert (
+            len(weights) == no_inputs
+        ), f"number of weights ({len(weights)}) must be equal to number of neuron inputs ({no_inputs})"
+
+        self.w = [Scalar(data=w_i) for w_i in weights]
         # bias == over trigger happiness of this neuron
-        self.b = Scalar(data=random.uniform(-1, 1))
+        self.b = Scalar(data=bias)
         self.name = "Tanh-Neuron"
 
     def __call__(self, x: list[float]) -> Scalar:
@@ -74,6 +104,23 @@ class Neuron(Module):
         """
         return f"{self.name}({len(self.w)})"
 
+    def jvp(self, x: list[Dual]) -> Dual:
+        """
+        Forward-mode pass of the neuron on dual numbers, builds no graph.
+
+        Parameters:
+            x: list[Dual]
+                input vector x with tangents
+
+        Returns:
+            out: Dual
+                output of the neuron with its tangent
+        """
+        activation = sum(
+            (x_i * w_i.data for w_i, x_i in zip(self.w, x)), start=Dual(self.b.data)
+        )
+        return activation.tanh()
+
     def parameters(self) -> Vector:
         """
         Returns a list of all parameters of this neuron.
@@ -86,7 +133,14 @@ class Neuron(Module):
 
 
 class Layer(Module):
-    def __init__(self, no_inputs: int, no_outputs: int, name: str = "Dense") -> None:
+    def __init__(
+        self,
+        no_inputs: int,
+        no_outputs: int,
+        name: str = "Dense",
+        init: str = "uniform",
+        rng: Seed = None,
+    ) -> None:
         """
         Layer of neurons.
 
@@ -97,8 +151,18 @@ class Layer(Module):
                 no of output neurons that this layer produces
             name: str
                 the name of the layer
+            init: str
+                initialization scheme, one of "uniform", "xavier" or "he"
+            rng: Seed
+                numpy random number generator or seed used for initialization
         """
-        self.neurons = [Neuron(no_inputs=no_inputs) for _ in range(no_outputs)]
+        # all weights and biases of the layer are drawn in a single call,
+        # the neurons still wrap every value into its own Scalar
+        rows = initialize(no_inputs, no_outputs, scheme=init, rng=rng)
+
+        self.neurons = [
+            Neuron(no_inputs=no_inputs, weights=row[:-1], bias=row[-1]) for row in rows
+        ]
         self.name = name
 
     def __call__(self, x: list[float]) -> Vector:
@@ -116,6 +180,20 @@ class Layer(Module):
         outs = [neuron(x) for neuron in self.neurons]
         return outs
 
+    def jvp(self, x: list[Dual]) -> list[Dual]:
+        """
+        Forward-mode pass of the layer on dual numbers, builds no graph.
+
+        Parameters:
+            x: list[Dual]
+                input vector x with tangents
+
+        Returns:
+            outs: list[Dual]
+                outputs of the layer with their tangents
+        """
+        return [neuron.jvp(x) for neuron in self.neurons]
+
     def __repr__(self) -> str:
         """
         Representation of the layer.
@@ -136,9 +214,145 @@ class Layer(Module):
         """
         return [param for neuron in self.neurons for param in neuron.parameters()]
 
+    def signature(self) -> Hashable:
+        """
+        The shape of this layer, used as cache key by the compiler.
+
+        Returns:
+            signature: Hashable
+                (no of inputs, no of outputs)
+        """
+        return len(self.neurons[0].w), len(self.neurons)
+
+
+class SparseLayer(Module):
+    def __init__(self, layer: Layer, name: str = "Sparse") -> None:
+        """
+        Layer of neurons storing only the non-zero weights in CSR form.
+
+        Row r of the CSR matrix holds the weights of neuron r: its non-zero weights are
+        values[indptr[r]:indptr[r + 1]] for the inputs indices[indptr[r]:indptr[r + 1]].
+        Forward and backward pass only touch the non-zeros. The weight scalars of the
+        dense layer are reused, so prune the layer before converting it.
+
+        Parameters:
+            layer: Layer
+                the (pruned) dense layer to convert
+            name: str
+                the name of the layer
+        """
+        self.no_inputs = len(layer.neurons[0].w)
+        self.indptr = [0]
+        self.indices: list[int] = []
+        self.values: Vector = []
+        self.biases: Vector = [neuron.b for neuron in layer.neurons]
+        self.name = name
+
+        for neuron in layer.neurons:
+            for index, w_i in enumerate(neuron.w):
+                if w_i.data != 0:
+                    self.indices.append(index)
+                    self.values.append(w_i)
+            self.indptr.append(len(self.values))
+
+    def __call__(self, x: list[float]) -> Vector:
+        """
+        Forward pass of the layer.
+
+        Parameters:
+            x: list[float]
+                input vector x
+
+        Returns:
+            outs: Vector
+                output of the layer
+        """
+        assert (
+            len(x) == self.no_inputs
+        ), f"input length of x ({len(x)}) must be equal to number of layer inputs ({self.no_inputs})"
+        outs = []
+
+        for row, bias in enumerate(self.biases):
+            start, end = self.indptr[row], self.indptr[row + 1]
+            activation = sum(
+                (self.values[k] * x[self.indices[k]] for k in range(start, end)),
+                start=bias,
+            )
+            outs.append(activation.tanh())
+
+        return outs
+
+    def jvp(self, x: list[Dual]) -> list[Dual]:
+        """
+        Forward-mode pass of the layer on dual numbers, builds no graph.
+
+        Parameters:
+            x: list[Dual]
+                input vector x with tangents
+
+        Returns:
+            outs: list[Dual]
+                outputs of the layer with their tangents
+        """
+        outs = []
+
+        for row, bias in enumerate(self.biases):
+            start, end = self.indptr[row], self.indptr[row + 1]
+            activation = sum(
+                (x[self.indices[k]] * self.values[k].data for k in range(start, end)),
+                start=Dual(bias.data),
+            )
+            outs.append(activation.tanh())
+
+        return outs
+
+    def __repr__(self) -> str:
+        """
+        Representation of the layer.
+
+        Returns:
+            representation: str
+                the string representation of the layer
+        """
+        return (
+            f"Layer of {len(self.biases)} Tanh-Neurons "
+            f"({len(self.values)}/{self.no_inputs * len(self.biases)} non-zero weights)"
+        )
+
+    def parameters(self) -> Vector:
+        """
+        Returns a list of all parameters of this layer.
+
+        Returns:
+            parameters: Vector
+                the non-zero weights followed by the biases
+        """
+        return self.values + self.biases
+
+    def signature(self) -> Hashable:
+        """
+        The shape and sparsity pattern of this layer, used as cache key by the compiler.
+
+        Returns:
+            signature: Hashable
+                (no of inputs, no of outputs, indptr, indices)
+        """
+        return (
+            self.no_inputs,
+            len(self.biases),
+            tuple(self.indptr),
+            tuple(self.indices),
+        )
+
 
 class MLP(Module):
-    def __init__(self, no_inputs: int, no_layer_outputs: list[int]) -> None:
+    def __init__(
+        self,
+        no_inputs: int,
+        no_layer_outputs: list[int],
+        init: str = "uniform",
+        seed: Seed = None,
+    ) -> None:
         """
         Multi-layer perceptron
 
@@ -151,15 +365,26 @@ class MLP(Module):
                 list of no of neurons per layer, e.g.
                     no_layer_outputs = [4, 4, 1]
                     => 2 hidden layers with 4 neurons each, 1 output layer with one neuron
+            init: str
+                initialization scheme, one of "uniform", "xavier" or "he"
+            seed: Seed
+                seed or numpy random number generator for reproducible initialization;
+                random.seed() does not affect the initialization, pass seed instead
 
         Returns:
             None
         """
+        rng = generator(seed)
         sizes = [no_inputs] + no_layer_outputs  # e.g. [3, 4, 4, 1]
         self.layers = [
-            Layer(no_inputs=sizes[i], no_outputs=sizes[i + 1])
+            Layer(no_inputs=sizes[i], no_outputs=sizes[i + 1], init=init, rng=rng)
             for i in range(len(no_layer_outputs))
         ]
+        # parameter list bound to the optimizer by partial_fit, built once
+        self._parameters: Optional[Vector] = None
+        # compiled forward and loss kernels, looked up once per architecture
+        self._forward_kernel: Optional[Callable] = None
+        self._loss_kernel: Optional[Callable] = None
 
     def __call__(self, x: list[float]) -> Vector:
         """
@@ -177,6 +402,33 @@ class MLP(Module):
             x = layer(x)
         return x
 
+    def jvp(self, x: list[float], v: list[float]) -> tuple[list[float], list[float]]:
+        """
+        Jacobian-vector product of the MLP with respect to its inputs (forward mode).
+
+        Computes the outputs and their directional derivative J(x) @ v in a single
+        pass using dual numbers, without building a graph or calling backward().
+
+        Parameters:
+            x: list[float]
+                input vector x
+            v: list[float]
+                direction (tangent) vector, same length as x
+
+        Returns:
+            outs, tangents: tuple[list[float], list[float]]
+                outputs of the MLP and the Jacobian-vector product
+        """
+        assert len(x) == len(
+            v
+        ), f"length of x ({len(x)}) must be equal to length of v ({len(v)})"
+        duals = [Dual(data=x_i, tangent=v_i) for x_i, v_i in zip(x, v)]
+
+        for layer in self.layers:
+            duals = layer.jvp(duals)
+
+        return [out.data for out in duals], [out.tangent for out in duals]
+
     def parameters(self) -> Vector:
         """
         Returns a list of all parameters of this MLP.
@@ -218,8 +470,134 @@ class MLP(Module):
         """
         return [self(x_i) for x_i in x]
 
+    def predict(self, x: list[list[float]]) -> list[list[float]]:
+        """
+        Inference with the compiled forward pass, builds no graph.
+
+        Parameters:
+            x: list[list[float]]
+                input vectors x
+
+        Returns:
+            out: list[list[float]]
+                output values of the MLP per input vector
+        """
+        if self._forward_kernel is None:
+            self._forward_kernel = compile_forward(self)
+        values = [param.data for param in self.parameters()]
+        return [self._forward_kernel(x_i, values) for x_i in x]
+
+    def _closure(
+        self,
+        x: list[list[float]],
+        y: list[float],
+        optimizer: Optimizer,
+        compiled: bool,
+        monitor: Optional[GraphMonitor] = None,
+    ) -> Callable[[], float]:
+        """
+        Creates the closure evaluating loss and gradients, see Optimizer.step.
+
+        Parameters
+            x: list[list[float]]
+                the input values
+            y: list[float]
+                the expected target values (labels)
+            optimizer: Optimizer
+                the optimizer whose parameters receive the gradients
+            compiled: bool
+                use the generated code of compiler.compile_loss
+            monitor: Optional[GraphMonitor]
+                records the loss graph of every evaluation
+
+        Returns
+            closure: Callable[[], float]
+                zeroes the gradients, runs forward and backward pass and returns the loss
+        """
+        if compiled and monitor is not None:
+            raise ValueError(
+                "monitor requires the interpreted Scalar graph, use compiled=False"
+            )
+
+        if compiled:
+            if self._loss_kernel is None:
+                self._loss_kernel = compile_loss(self)
+            kernel = self._loss_kernel
+
+        def closure() -> float:
+            if compiled:
+                # forward pass, mse loss and backward pass in one generated function,
+                # every gradient is overwritten, so there is nothing to zero
+                values = [param.data for param in optimizer.parameters]
+                loss, (grads,) = kernel(x, y, values)
+                for param, grad in zip(optimizer.parameters, grads):
+                    param.grad = grad
+                return loss
+
+            # zero grad
+            optimizer.zero_grad()
+
+            # forward pass
+            y_preds = self.forward(x)
+
+            # mse loss
+            loss = mean_squared_error(y, y_preds)
+
+            # backward pass
+            loss.backward()
+
+            if monitor is not None:
+                monitor.record(loss, optimizer.parameters)
+
+            return loss.data
+
+        return closure
+
+    def partial_fit(
+        self,
+        x: list[list[float]],
+        y: list[float],
+        optimizer: Optimizer,
+        compiled: bool = False,
+    ) -> float:
+        """
+        Performs a single update on one batch, for online / incremental learning.
+
+        The parameter list is built and bound to the optimizer only on the first call,
+        so the optimizer keeps its state across calls.
+
+        Parameters
+            x: list[list[float]]
+                the input values of the batch
+            y: list[float]
+                the expected target values (labels) of the batch
+            optimizer: Optimizer
+                the optimizer to be used
+            compiled: bool
+                use the generated code of compiler.compile_loss
+
+        Returns
+            loss: float
+                the loss of the batch before the update
+        """
+        if self._parameters is None:
+            self._parameters = self.parameters()
+        if getattr(optimizer, "parameters", None) is not self._parameters:
+            optimizer.parameters = self._parameters
+
+        closure = self._closure(x=x, y=y, optimizer=optimizer, compiled=compiled)
+        return _step(optimizer=optimizer, closure=closure)
+
     def fit(
-        self, x: list[list[float]], y: list[float], optimizer: Optimizer, epochs: int
+        self,
+        x: list[list[float]],
+        y: list[float],
+        optimizer: Optimizer,
+        epochs: int,
+        compiled: bool = False,
+        checkpointer: Optional[Checkpointer] = None,
+        resume: Optional[str] = None,
+        monitor: Optional[GraphMonitor] = None,
     ) -> dict:
         """
         Performs training loop - gradient descent
@@ -233,6 +611,18 @@ class MLP(Module):
                 the optimizer to be used
             epochs: int
                 no of epochs (full x iterations)
+            compiled: bool
+                run forward and backward pass through the generated code of
+                compiler.compile_loss instead of interpreting the Scalar graph
+            checkpointer: Optional[Checkpointer]
+                saves parameters, optimizer state and history in the background
+                whenever a checkpoint is due
+            resume: Optional[str]
+                path of a checkpoint to resume from, e.g. checkpointer.latest();
+                training continues after its epoch up to `epochs`
+            monitor: Optional[GraphMonitor]
+                records size and memory of the loss graph of every evaluation
+                (one per epoch with SGD), raises ValueError with compiled=True
 
         Returns
             history: dict
@@ -240,24 +630,139 @@ class MLP(Module):
         """
         history = {"loss": []}
         optimizer.parameters = self.parameters()
+        start = 0
+
+        closure = self._closure(
+            x=x, y=y, optimizer=optimizer, compiled=compiled, monitor=monitor
+        )
+
+        if resume is not None:
+            from .checkpoint import load_checkpoint
+
+            checkpoint = load_checkpoint(resume)
+            assert len(checkpoint["parameters"]) == len(
+                optimizer.parameters
+            ), "checkpoint does not match the model parameters"
+            for param, value in zip(optimizer.parameters, checkpoint["parameters"]):
+                param.data = value
+            optimizer.load_state(checkpoint["optimizer"])
+            history = {"loss": []} | checkpoint["history"]
+            start = checkpoint["epoch"] + 1
+
+        if checkpointer is not None:
+            checkpointer.start()
+
+        try:
+            for i in range(start, epochs):
+                # evaluation of loss and gradients and update of weights and biases
+                loss = _step(optimizer=optimizer, closure=closure)
+                history["loss"].append(loss)
+
+                print(f"epoch {i} loss: {loss}")
+
+                if checkpointer is not None and checkpointer.due(epoch=i):
+                    # only the in-memory copy happens here, writing is in background
+                    checkpointer.save(
+                        epoch=i,
+                        parameters=optimizer.parameters,
+                        optimizer=optimizer,
+                        history=history,
+                    )
+        except BaseException:
+            # also when training is interrupted, e.g. by KeyboardInterrupt; a failed
+            # write must not replace the exception that interrupted training
+            if checkpointer is not None:
+                try:
+                    checkpointer.flush()
+                except RuntimeError as error:
+                    warnings.warn(f"{error}: {error.__cause__!r}", RuntimeWarning)
+            raise
+
+        if checkpointer is not None:
+            checkpointer.flush()
 
-        for i in range(epochs):
-            # forward pass
-            y_preds = self.forward(x)
+        return history
 
-            # zero grad
-            optimizer.zero_grad()
 
-            # mse loss
-            loss = mean_squared_error(y, y_preds)
-            history["loss"].append(loss.data)
+def _step(optimizer: Optimizer, closure: Callable[[], float]) -> float:
+    """
+    Performs one optimization step, passing the closure only to optimizers that
+    require it, so optimizers implementing step(self) keep working.
+    """
+    if optimizer.requires_closure:
+        return optimizer.step(closure=closure)
 
-            print(f"epoch {i} loss: {loss.data}")
+    loss = closure()
+    optimizer.step()
+    return loss
 
-            # backward pass
-            loss.backward()
 
-            # update of weights and biases
-            optimizer.step()
+def jvp(model: MLP, x: list[float], v: list[float]) -> tuple[list[float], list[float]]:
+    """
+    Jacobian-vector product of a model with respect to its inputs (forward mode).
+
+    Parameters:
+        model: MLP
+            the model to differentiate
+        x: list[float]
+            input vector x
+        v: list[float]
+            direction (tangent) vector, same length as x
+
+    Returns:
+        outs, tangents: tuple[list[float], list[float]]
+            outputs of the model and the Jacobian-vector product
+    """
+    return model.jvp(x=x, v=v)
 
-        return history
+
+def prune(model: MLP, sparsity: float) -> MLP:
+    """
+    Magnitude pruning: zeroes the smallest weights of every dense layer in place.
+
+    Biases are kept. Use sparsify() afterwards to drop the zeroed weights.
+
+    Parameters:
+        model: MLP
+            the model to prune
+        sparsity: float
+            fraction of weights per layer to set to zero, e.g. 0.9
+
+    Returns:
+        model: MLP
+            the pruned model
+    """
+    assert 0.0 <= sparsity <= 1.0, f"sparsity ({sparsity}) must be in [0, 1]"
+
+    for layer in model.layers:
+        if not isinstance(layer, Layer):
+            continue
+        weights = [w_i for neuron in layer.neurons for w_i in neuron.w]
+        weights.sort(key=lambda w_i: abs(w_i.data))
+        for w_i in weights[: int(sparsity * len(weights))]:
+            w_i.data = 0.0
+
+    return model
+
+
+def sparsify(model: MLP) -> MLP:
+    """
+    Replaces every dense layer of a (pruned) model with a SparseLayer in place.
+
+    Parameters:
+        model: MLP
+            the model to convert
+
+    Returns:
+        model: MLP
+            the model with sparse layers
+    """
+    model.layers = [
+        SparseLayer(layer=layer) if isinstance(layer, Layer) else layer
+        for layer in model.layers
+    ]
+    # the pruned weights are no parameters anymore, the architecture changed
+    model._parameters = None
+    model._forward_kernel = None
+    model._loss_kernel = None
+    return model
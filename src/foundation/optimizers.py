@@ -1,9 +1,16 @@
-from src.foundation.core import Vector
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from .core import Vector
 
 
 class Optimizer:
 
     parameters: Vector
+    # True if step() must re-evaluate the model itself, e.g. for a line search;
+    # otherwise MLP.fit evaluates the closure and calls step() without arguments
+    requires_closure: bool = False
 
     def __init__(self, learning_rate: float = 0.001) -> None:
         """
@@ -25,24 +32,65 @@ class Optimizer:
         for param in self.parameters:
             param.grad = 0.0
 
-    def step(self) -> None:
+    def step(self, closure: Optional[Callable[[], float]] = None) -> Optional[float]:
         """
         Performs a single optimization step.
 
+        Subclasses that only use the gradients may implement step(self), MLP.fit
+        passes the closure only if requires_closure is set.
+
+        Parameters:
+            closure: Optional[Callable[[], float]]
+                re-evaluates the model: zeroes the gradients, computes the loss,
+                runs the backward pass and returns the loss
+
         Returns:
-            None
+            loss: Optional[float]
+                the loss before the step if a closure was given
         """
         raise NotImplementedError
 
+    def state(self) -> dict:
+        """
+        A copy of the optimizer state, e.g. for checkpointing.
+
+        Returns:
+            state: dict
+                the hyperparameters and internal buffers of the optimizer
+        """
+        return {"lr": self.lr}
+
+    def load_state(self, state: dict) -> None:
+        """
+        Restores the optimizer state returned by state().
+
+        Parameters:
+            state: dict
+                the state to restore
+
+        Returns:
+            None
+        """
+        self.lr = state["lr"]
+
 
 class SGD(Optimizer):
-    def step(self) -> None:
+    def step(self, closure: Optional[Callable[[], float]] = None) -> Optional[float]:
         """
         Performs a single optimization step.
 
+        Parameters:
+            closure: Optional[Callable[[], float]]
+                computes loss and gradients before the step if given
+
         Returns:
-            None
+            loss: Optional[float]
+                the loss before the step if a closure was given
         """
+        loss = closure() if closure is not None else None
+
         for param in self.parameters:
             # modify the gradient by a small step size in the direction of the gradient
             param.data += -1 * self.lr * param.grad
+
+        return loss
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import numpy as np
+
+from .nn import MLP, Layer, SparseLayer
+
+"""
+Post-training int8 quantization of trained MLPs for fast batched inference.
+
+Weights are quantized symmetrically per layer to int8, inputs of every layer are
+quantized to int8 with a scale calibrated on sample data, the matrix products are
+accumulated in int32 and only the tanh non-linearity is evaluated in float.
+"""
+
+INT8_MAX = 127
+
+
+def dense_weights(layer: Layer | SparseLayer) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Extracts the float weights and biases of a layer.
+
+    Parameters:
+        layer: Layer | SparseLayer
+            the layer to extract the weights from
+
+    Returns:
+        weights, biases: tuple[np.ndarray, np.ndarray]
+            weight matrix of shape (no_outputs, no_inputs) and bias vector
+    """
+    if isinstance(layer, SparseLayer):
+        weights = np.zeros((len(layer.biases), layer.no_inputs))
+        for row in range(len(layer.biases)):
+            for k in range(layer.indptr[row], layer.indptr[row + 1]):
+                weights[row, layer.indices[k]] = layer.values[k].data
+        biases = np.array([bias.data for bias in layer.biases])
+        return weights, biases
+
+    weights = np.array([[w_i.data for w_i in neuron.w] for neuron in layer.neurons])
+    biases = np.array([neuron.b.data for neuron in layer.neurons])
+    return weights, biases
+
+
+def scale(values: np.ndarray) -> float:
+    """
+    Symmetric int8 scale mapping the largest absolute value to 127.
+
+    Parameters:
+        values: np.ndarray
+            the float values to be quantized
+
+    Returns:
+        scale: float
+            the quantization step size
+    """
+    max_abs = float(np.max(np.abs(values))) if values.size else 0.0
+    return max_abs / INT8_MAX if max_abs > 0 else 1.0
+
+
+def quantize_values(values: np.ndarray, step: float) -> np.ndarray:
+    """
+    Quantizes float values to int8 with a symmetric scale.
+
+    Parameters:
+        values: np.ndarray
+            the float values
+        step: float
+            the quantization step size
+
+    Returns:
+        quantized: np.ndarray
+            the int8 values, clipped to [-127, 127]
+    """
+    return np.clip(np.rint(values / step), -INT8_MAX, INT8_MAX).astype(np.int8)
+
+
+class QuantizedLayer:
+    def __init__(
+        self, weights: np.ndarray, biases: np.ndarray, input_scale: float
+    ) -> None:
+        """
+        Layer of tanh neurons with int8 weights and int32 accumulation.
+
+        Parameters:
+            weights: np.ndarray
+                float weight matrix of shape (no_outputs, no_inputs)
+            biases: np.ndarray
+                float bias vector
+            input_scale: float
+                the calibrated quantization step size of the layer inputs
+
+        Returns:
+            None
+        """
+        self.weight_scale = scale(weights)
+        self.input_scale = input_scale
+        # transposed so that a batch of inputs (batch, no_inputs) multiplies directly
+        self.weights = quantize_values(weights, self.weight_scale).T.copy()
+        # the bias is added to the int32 accumulator, so it shares its scale
+        self.output_scale = self.weight_scale * self.input_scale
+        self.biases = np.rint(biases / self.output_scale).astype(np.int32)
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        """
+        Forward pass of the layer on a quantized batch.
+
+        Parameters:
+            x: np.ndarray
+                int8 inputs of shape (batch, no_inputs), quantized with input_scale
+
+        Returns:
+            out: np.ndarray
+                float outputs of shape (batch, no_outputs)
+        """
+        accumulator = np.matmul(x, self.weights, dtype=np.int32) + self.biases
+        return np.tanh(accumulator * np.float32(self.output_scale))
+
+    def __repr__(self) -> str:
+        """
+        Representation of the layer.
+
+        Returns:
+            representation: str
+                the string representation of the layer
+        """
+        return f"QuantizedLayer({self.weights.shape[0]}, {self.weights.shape[1]})"
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory used by the weights and biases in bytes.
+
+        Returns:
+            nbytes: int
+                size of the weight and bias buffers
+        """
+        return self.weights.nbytes + self.biases.nbytes
+
+
+class QuantizedMLP:
+    def __init__(self, layers: list[QuantizedLayer]) -> None:
+        """
+        Integer-arithmetic inference model, created by quantize().
+
+        Parameters:
+            layers: list[QuantizedLayer]
+                the quantized layers
+
+        Returns:
+            None
+        """
+        self.layers = layers
+
+    def predict(self, x: list[list[float]] | np.ndarray) -> np.ndarray:
+        """
+        Batched inference.
+
+        Parameters:
+            x: list[list[float]] | np.ndarray
+                input vectors of shape (batch, no_inputs)
+
+        Returns:
+            out: np.ndarray
+                outputs of shape (batch, no_outputs)
+        """
+        out = np.asarray(x, dtype=np.float32)
+
+        for layer in self.layers:
+            out = layer(quantize_values(out, layer.input_scale))
+
+        return out
+
+    def __repr__(self) -> str:
+        """
+        Representation of the model.
+
+        Returns:
+            representation: str
+                the string representation of the model
+        """
+        return f"QuantizedMLP({', '.join(map(repr, self.layers))})"
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory used by all layers in bytes.
+
+        Returns:
+            nbytes: int
+                size of all weight and bias buffers
+        """
+        return sum(layer.nbytes for layer in self.layers)
+
+
+def quantize(model: MLP, x: list[list[float]]) -> QuantizedMLP:
+    """
+    Post-training quantization of a trained model.
+
+    Runs the float model on the calibration data to find the input range of every
+    layer, then quantizes weights, biases and inputs per layer.
+
+    Parameters:
+        model: MLP
+            the trained model
+        x: list[list[float]]
+            calibration inputs, representative of the inference data
+
+    Returns:
+        quantized: QuantizedMLP
+            the integer-arithmetic inference model
+    """
+    activations = np.asarray(x, dtype=np.float64)
+    layers = []
+
+    for layer in model.layers:
+        weights, biases = dense_weights(layer)
+        layers.append(
+            QuantizedLayer(
+                weights=weights, biases=biases, input_scale=scale(activations)
+            )
+        )
+        activations = np.tanh(activations @ weights.T + biases)
+
+    return QuantizedMLP(layers=layers)
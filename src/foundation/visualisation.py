@@ -1,6 +1,11 @@
-import graphviz
+from __future__ import annotations
 
-from src.foundation.core import Scalar
+from typing import TYPE_CHECKING
+
+from .core import Scalar
+
+if TYPE_CHECKING:
+    import graphviz
 
 
 """
@@ -46,6 +51,14 @@ def draw_graph(root: Scalar) -> graphviz.Digraph:
         graph: graphviz.Digraph
             A graphviz graph of the computation graph.
     """
+    # graphviz is an optional dependency, only needed when actually drawing
+    try:
+        import graphviz
+    except ImportError as error:
+        raise ImportError(
+            "draw_graph requires graphviz, install it with `pip install foundation[visualisation]`"
+        ) from error
+
     graph = graphviz.Digraph(format="svg", graph_attr={"rankdir": "LR"})
     nodes, edges = trace(root=root)
 
@@ -0,0 +1,138 @@
+import os
+import tempfile
+import unittest
+
+from src.foundation.checkpoint import Checkpointer, load_checkpoint
+from src.foundation.core import Scalar
+from src.foundation.lbfgs import LBFGS
+from src.foundation.nn import MLP
+from src.foundation.optimizers import SGD
+
+
+class CheckpointTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_due(self):
+        checkpointer = Checkpointer(self.directory.name, every_epochs=5)
+        self.assertFalse(checkpointer.due(epoch=0))
+        self.assertTrue(checkpointer.due(epoch=4))
+
+        checkpointer = Checkpointer(self.directory.name, every_seconds=0.0)
+        self.assertTrue(checkpointer.due(epoch=0))
+
+        self.assertFalse(Checkpointer(self.directory.name).due(epoch=0))
+
+    def test_start(self):
+        checkpointer = Checkpointer(self.directory.name, every_seconds=60.0)
+        checkpointer._last_save -= 120.0
+        self.assertTrue(checkpointer.due(epoch=0))
+
+        # the interval counts from the start of training, not from construction
+        checkpointer.start()
+        self.assertFalse(checkpointer.due(epoch=0))
+
+    def test_save(self):
+        checkpointer = Checkpointer(self.directory.name, keep=2)
+        parameters = [Scalar(1.0), Scalar(2.0)]
+        optimizer = SGD(learning_rate=0.1)
+
+        for epoch in range(4):
+            checkpointer.save(epoch, parameters, optimizer, history={"loss": [1.0]})
+            checkpointer.flush()
+        # the snapshot is a copy, later changes are not written
+        parameters[0].data = 5.0
+        checkpointer.close()
+
+        checkpoints = checkpointer.checkpoints()
+        self.assertEqual(2, len(checkpoints))
+        self.assertEqual(checkpoints[-1], checkpointer.latest())
+        self.assertEqual(
+            [], [f for f in os.listdir(self.directory.name) if f.endswith(".tmp")]
+        )
+
+        checkpoint = load_checkpoint(checkpointer.latest())
+        self.assertEqual(3, checkpoint["epoch"])
+        self.assertEqual([1.0, 2.0], checkpoint["parameters"])
+        self.assertEqual({"lr": 0.1}, checkpoint["optimizer"])
+        self.assertEqual({"loss": [1.0]}, checkpoint["history"])
+
+    def test_write_error(self):
+        path = os.path.join(self.directory.name, "file")
+        open(path, "w").close()
+        checkpointer = Checkpointer(os.path.join(path, "checkpoints"))
+
+        checkpointer.save(0, [Scalar(1.0)], SGD())
+        with self.assertRaises(RuntimeError):
+            checkpointer.flush()
+
+    def test_fit_resume(self):
+        xs = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5], [0.5, 1.0, 3.0], [3.0, 1.0, -1.0]]
+        ys = [1.0, -1.0, -1.0, 1.0]
+
+        expected = MLP(no_inputs=3, no_layer_outputs=[4, 4, 1], seed=0)
+        expected_history = expected.fit(xs, ys, LBFGS(), epochs=10, compiled=True)
+
+        # interrupted run, checkpointed every 3 epochs
+        checkpointer = Checkpointer(self.directory.name, every_epochs=3, keep=2)
+        model = MLP(no_inputs=3, no_layer_outputs=[4, 4, 1], seed=0)
+        model.fit(xs, ys, LBFGS(), epochs=7, compiled=True, checkpointer=checkpointer)
+        # epoch 2 may have been superseded by epoch 5 before it was written
+        self.assertLessEqual(len(checkpointer.checkpoints()), 2)
+        self.assertEqual(5, load_checkpoint(checkpointer.latest())["epoch"])
+
+        resumed = MLP(no_inputs=3, no_layer_outputs=[4, 4, 1], seed=1)
+        history = resumed.fit(
+            xs, ys, LBFGS(), epochs=10, compiled=True, resume=checkpointer.latest()
+        )
+        checkpointer.close()
+
+        self.assertEqual(10, len(history["loss"]))
+        for expected_loss, loss in zip(expected_history["loss"], history["loss"]):
+            self.assertAlmostEqual(expected_loss, loss)
+
+    def test_fit_interrupted(self):
+        xs = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5]]
+        ys = [1.0, -1.0]
+        steps = 0
+
+        class Interrupted(SGD):
+            def step(self, closure=None):
+                nonlocal steps
+                steps += 1
+                if steps == 4:
+                    raise KeyboardInterrupt
+                return super().step(closure=closure)
+
+        checkpointer = Checkpointer(self.directory.name, every_epochs=1)
+        model = MLP(no_inputs=3, no_layer_outputs=[4, 1], seed=0)
+        with self.assertRaises(KeyboardInterrupt):
+            model.fit(xs, ys, Interrupted(), epochs=10, checkpointer=checkpointer)
+
+        # the snapshot of the last finished epoch was flushed before propagating
+        self.assertEqual(2, load_checkpoint(checkpointer.latest())["epoch"])
+        checkpointer.close()
+
+    def test_fit_interrupted_write_error(self):
+        path = os.path.join(self.directory.name, "file")
+        open(path, "w").close()
+
+        class Interrupted(SGD):
+            def step(self):
+                raise KeyboardInterrupt
+
+        checkpointer = Checkpointer(os.path.join(path, "checkpoints"), every_epochs=1)
+        checkpointer.save(0, [Scalar(1.0)], SGD())
+        model = MLP(no_inputs=3, no_layer_outputs=[4, 1], seed=0)
+
+        # the interruption propagates, the failed write is only reported
+        with self.assertWarns(RuntimeWarning):
+            with self.assertRaises(KeyboardInterrupt):
+                model.fit(
+                    [[1.0, 4.0, -1.0]],
+                    [1.0],
+                    Interrupted(),
+                    epochs=3,
+                    checkpointer=checkpointer,
+                )
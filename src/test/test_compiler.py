@@ -0,0 +1,113 @@
+import unittest
+
+from src.foundation.compiler import (
+    compile_forward,
+    compile_graph,
+    compile_loss,
+    generate_source,
+    topological_order,
+)
+from src.foundation.core import Scalar
+from src.foundation.nn import MLP
+from src.foundation.optimizers import SGD
+
+
+class CompilerTests(unittest.TestCase):
+    def test_topological_order(self):
+        a = Scalar(2.0)
+        b = Scalar(3.0)
+        c = a * b
+        d = c + a
+
+        topo = topological_order([d])
+
+        self.assertEqual(4, len(topo))
+        self.assertEqual(d, topo[-1])
+        self.assertLess(topo.index(a), topo.index(c))
+        self.assertLess(topo.index(b), topo.index(c))
+
+    def test_compile_graph(self):
+        a = Scalar(0.5)
+        b = Scalar(-1.5)
+        out = ((a * b + a * a).tanh() - b.exp() + (a + a).relu()) ** 2 / 3.0
+        out.backward()
+
+        kernel = compile_graph(outputs=[out], arguments={"p": [a, b]}, wrt=("p",))
+        value, (grads,) = kernel([0.5, -1.5])
+
+        self.assertAlmostEqual(out.data, value)
+        self.assertAlmostEqual(a.grad, grads[0])
+        self.assertAlmostEqual(b.grad, grads[1])
+
+        # leaves are read at call time, constants are inlined
+        self.assertEqual([out.data], compile_graph([out], {"p": [a, b]})([0.5, -1.5]))
+        self.assertIn("(3.0)", generate_source([out], {"p": [a, b]}))
+
+    def test_compile_forward(self):
+        model = MLP(no_inputs=3, no_layer_outputs=[4, 4, 2])
+        x = [1.0, -2.0, 0.5]
+
+        kernel = compile_forward(model)
+        outs = kernel(x, [param.data for param in model.parameters()])
+
+        for expected, actual in zip(model(x), outs):
+            self.assertAlmostEqual(expected.data, actual)
+
+        self.assertEqual([outs], model.predict([x]))
+
+        # cached by architecture
+        self.assertIs(
+            kernel, compile_forward(MLP(no_inputs=3, no_layer_outputs=[4, 4, 2]))
+        )
+
+    def test_compile_loss(self):
+        xs = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5]]
+        ys = [1.0, -1.0]
+        model = MLP(no_inputs=3, no_layer_outputs=[4, 1])
+
+        kernel = compile_loss(model)
+        loss, (grads,) = kernel(xs, ys, [param.data for param in model.parameters()])
+
+        optimizer = SGD()
+        optimizer.parameters = model.parameters()
+        optimizer.zero_grad()
+        expected = sum((model(x_i)[0] - y_i) ** 2 for x_i, y_i in zip(xs, ys))
+        expected.backward()
+
+        self.assertAlmostEqual(expected.data, loss)
+        for param, grad in zip(model.parameters(), grads):
+            self.assertAlmostEqual(param.grad, grad)
+
+        # a single sample is compiled, so the kernel serves every batch size
+        self.assertIs(kernel, compile_loss(MLP(no_inputs=3, no_layer_outputs=[4, 1])))
+        loss, _ = kernel(xs[:1], ys[:1], [param.data for param in model.parameters()])
+        self.assertAlmostEqual(((model(xs[0])[0] - ys[0]) ** 2).data, loss)
+
+    def test_generate_source_wrt(self):
+        x = Scalar(2.0)
+        p = Scalar(3.0)
+        out = (x * p).tanh()
+
+        source = generate_source([out], {"x": [x], "p": [p]}, wrt=("p",))
+
+        # x is v0, only the gradient of p is accumulated
+        self.assertNotIn("g0", source)
+        self.assertIn("g1 =", source)
+
+    def test_fit_compiled(self):
+        xs = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5], [0.5, 1.0, 3.0], [3.0, 1.0, -1.0]]
+        ys = [1.0, -1.0, -1.0, 1.0]
+
+        interpreted = MLP(no_inputs=3, no_layer_outputs=[4, 4, 1])
+        compiled = MLP(no_inputs=3, no_layer_outputs=[4, 4, 1])
+        for source, target in zip(interpreted.parameters(), compiled.parameters()):
+            target.data = source.data
+
+        expected = interpreted.fit(xs, ys, optimizer=SGD(learning_rate=0.1), epochs=20)
+        history = compiled.fit(
+            xs, ys, optimizer=SGD(learning_rate=0.1), epochs=20, compiled=True
+        )
+
+        for expected_loss, loss in zip(expected["loss"], history["loss"]):
+            self.assertAlmostEqual(expected_loss, loss)
+        self.assertLess(history["loss"][-1], history["loss"][0])
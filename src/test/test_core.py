@@ -1,6 +1,6 @@
 import unittest
 
-from src.foundation.core import Scalar
+from src.foundation.core import Dual, Scalar
 
 
 class FoundationTest(unittest.TestCase):
@@ -11,6 +11,11 @@ class FoundationTest(unittest.TestCase):
         self.assertEqual(2.0, a.data)
         self.assertEqual("Scalar(data=2.0)", str(a))
 
+        # leaves share one empty children set
+        self.assertIs(a.children, Scalar(data=3.0).children)
+        self.assertEqual(set(), a.children)
+        self.assertIn(a, (a * 2.0).children)
+
     def test_add(self):
         a = Scalar(data=2.0)
         b = Scalar(data=5.0)
@@ -125,3 +130,28 @@ class FoundationTest(unittest.TestCase):
 
         b = 4
         self.assertEqual(-2, (a - b).data)
+
+    def test_dual(self):
+        x = Dual(data=2.0, tangent=1.0)
+
+        self.assertEqual("Dual(data=2.0, tangent=1.0)", str(x))
+
+        y = 3.0 * x + x**2 - 1.0  # dy/dx = 3 + 2x
+        self.assertEqual(9.0, y.data)
+        self.assertEqual(7.0, y.tangent)
+
+        y = x / Dual(data=4.0)  # dy/dx = 1/4
+        self.assertEqual(0.5, y.data)
+        self.assertEqual(0.25, y.tangent)
+
+    def test_dual_matches_backward(self):
+        for op in ("tanh", "relu", "exp"):
+            for value in (-0.7, 0.3):
+                a = Scalar(value)
+                out = getattr(a, op)()
+                out.backward()
+
+                dual = getattr(Dual(data=value, tangent=1.0), op)()
+
+                self.assertAlmostEqual(out.data, dual.data)
+                self.assertAlmostEqual(a.grad, dual.tangent)
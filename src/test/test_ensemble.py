@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+
+from src.foundation.ensemble import make_ensemble, stack
+from src.foundation.nn import MLP
+from src.foundation.optimizers import SGD
+
+
+class EnsembleTests(unittest.TestCase):
+    def test_ensemble(self):
+        models = make_ensemble(no_inputs=3, no_layer_outputs=[4, 1], seeds=[0, 1, 2])
+
+        self.assertEqual(3, len(models))
+        self.assertEqual("Ensemble of 3 MLPs [3, 4, 1]", str(models))
+        self.assertEqual((3, 4, 3), models.weights[0].shape)
+        self.assertEqual((3, 1), models.biases[1].shape)
+
+        expected = MLP(no_inputs=3, no_layer_outputs=[4, 1], seed=1)
+        model = models.unstack()[1]
+        self.assertEqual(
+            [param.data for param in expected.parameters()],
+            [param.data for param in model.parameters()],
+        )
+
+        with self.assertRaises(ValueError):
+            make_ensemble(no_inputs=3, no_layer_outputs=[4, 1], seeds=[0], init="zeros")
+
+    def test_predict(self):
+        models = [MLP(no_inputs=3, no_layer_outputs=[4, 2], seed=k) for k in range(2)]
+        xs = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5]]
+
+        predictions = stack(models).predict(xs)
+        self.assertEqual((2, 2, 2), predictions.shape)
+
+        for k, model in enumerate(models):
+            expected = [[out.data for out in model(x)] for x in xs]
+            self.assertTrue(np.allclose(expected, predictions[k]))
+
+    def test_fit(self):
+        xs = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5], [0.5, 1.0, 3.0], [3.0, 1.0, -1.0]]
+        ys = [1.0, -1.0, -1.0, 1.0]
+        learning_rates = [0.01, 0.05, 0.1]
+
+        models = make_ensemble(no_inputs=3, no_layer_outputs=[4, 4, 1], seeds=[0, 1, 2])
+        histories = models.fit(xs, ys, learning_rates=learning_rates, epochs=20)
+
+        self.assertEqual(3, len(histories))
+        for k, learning_rate in enumerate(learning_rates):
+            model = MLP(no_inputs=3, no_layer_outputs=[4, 4, 1], seed=k)
+            expected = model.fit(xs, ys, SGD(learning_rate=learning_rate), epochs=20)
+
+            self.assertTrue(np.allclose(expected["loss"], histories[k]["loss"]))
+            self.assertTrue(
+                np.allclose(
+                    [param.data for param in model.parameters()],
+                    [param.data for param in models.unstack()[k].parameters()],
+                )
+            )
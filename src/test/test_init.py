@@ -0,0 +1,42 @@
+import subprocess
+import sys
+import unittest
+
+import src.foundation as foundation
+from src.foundation.core import Scalar
+from src.foundation.nn import MLP
+from src.foundation.optimizers import SGD
+
+
+class InitTests(unittest.TestCase):
+    def test_public_names(self):
+        self.assertIs(Scalar, foundation.Scalar)
+        self.assertIs(MLP, foundation.MLP)
+        self.assertIs(SGD, foundation.SGD)
+
+        self.assertIn("Scalar", dir(foundation))
+
+    def test_submodules(self):
+        for name in ("ensemble", "initializers", "introspection"):
+            self.assertEqual(
+                f"src.foundation.{name}", getattr(foundation, name).__name__
+            )
+        self.assertIs(foundation.ensemble.make_ensemble, foundation.make_ensemble)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            foundation.DoesNotExist
+
+    def test_lazy_import(self):
+        code = (
+            "import sys; import src.foundation as f; "
+            "assert 'src.foundation.nn' not in sys.modules; "
+            "f.SGD; "
+            "assert 'numpy' not in sys.modules; "
+            "f.MLP; "
+            "assert 'src.foundation.nn' in sys.modules; "
+            "assert 'src.foundation.checkpoint' not in sys.modules; "
+            "assert 'src.foundation.introspection' not in sys.modules; "
+            "assert 'graphviz' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,38 @@
+import math
+import unittest
+
+import numpy as np
+
+from src.foundation.initializers import generator, initialize
+
+
+class InitializersTests(unittest.TestCase):
+    def test_uniform(self):
+        rows = initialize(no_inputs=3, no_outputs=2, scheme="uniform", rng=0)
+
+        self.assertEqual(2, len(rows))
+        self.assertEqual(3 + 1, len(rows[0]))  # 3 weights, 1 bias
+        self.assertTrue(all(-1 <= value < 1 for row in rows for value in row))
+
+        self.assertEqual(rows, initialize(no_inputs=3, no_outputs=2, rng=0))
+
+    def test_xavier(self):
+        rows = np.array(initialize(no_inputs=300, no_outputs=100, scheme="xavier"))
+        limit = math.sqrt(6 / 400)
+
+        self.assertLessEqual(np.max(np.abs(rows[:, :-1])), limit)
+        self.assertTrue(np.all(rows[:, -1] == 0.0))
+
+    def test_he(self):
+        rows = np.array(initialize(no_inputs=200, no_outputs=500, scheme="he", rng=1))
+
+        self.assertAlmostEqual(math.sqrt(2 / 200), np.std(rows[:, :-1]), places=2)
+        self.assertTrue(np.all(rows[:, -1] == 0.0))
+
+    def test_unknown_scheme(self):
+        with self.assertRaises(ValueError):
+            initialize(no_inputs=3, no_outputs=2, scheme="zeros")
+
+    def test_generator(self):
+        rng = generator(0)
+        self.assertIs(rng, generator(rng))
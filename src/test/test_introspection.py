@@ -0,0 +1,72 @@
+import unittest
+
+from src.foundation.core import Scalar
+from src.foundation.introspection import (
+    GraphMonitor,
+    graph_stats,
+    live_scalars,
+    model_graph_stats,
+)
+from src.foundation.nn import MLP
+from src.foundation.optimizers import SGD
+
+
+class IntrospectionTests(unittest.TestCase):
+    def test_graph_stats(self):
+        a = Scalar(2.0)
+        b = Scalar(-3.0)
+        c = (a * b + 1.0).tanh()
+
+        stats = graph_stats(c, parameters=[a, b])
+        print(stats)
+        stats.summary()
+
+        self.assertEqual(6, stats.nodes)  # a, b, a * b, 1.0, + and tanh
+        self.assertEqual({"*": 1, "+": 1, "tanh": 1}, stats.operations)
+        self.assertEqual(4, stats.depth)  # a -> * -> + -> tanh
+        self.assertEqual(3, stats.closures)
+        self.assertEqual(3, stats.leaves)
+        self.assertEqual(2, stats.parameters)
+        self.assertEqual(1, stats.constants)  # 1.0 wrapped by __add__
+        self.assertGreater(stats.nbytes, 0)
+
+    def test_deep_graph(self):
+        out = Scalar(0.0)
+        for _ in range(5000):
+            out = out + 1.0
+
+        stats = graph_stats(out)
+        self.assertEqual(5001, stats.depth)
+        self.assertEqual(5001, stats.leaves)  # the first scalar and 5000 wrapped 1.0s
+
+    def test_model_graph_stats(self):
+        model = MLP(no_inputs=3, no_layer_outputs=[4, 1], seed=0)
+        xs = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5]]
+
+        outputs = model_graph_stats(model, xs)
+        self.assertEqual(21, outputs.parameters)
+        self.assertEqual(2 * 5, outputs.operations["tanh"])
+
+        loss = model_graph_stats(model, xs, y=[1.0, -1.0])
+        self.assertGreater(loss.nodes, outputs.nodes)
+        self.assertEqual(2, loss.operations["**2"])
+
+    def test_monitor(self):
+        xs = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5]]
+        ys = [1.0, -1.0]
+        model = MLP(no_inputs=3, no_layer_outputs=[4, 1], seed=0)
+
+        monitor = GraphMonitor(track_live=True)
+        model.fit(xs, ys, SGD(learning_rate=0.1), epochs=3, monitor=monitor)
+
+        self.assertEqual(3, len(monitor.history))
+        self.assertEqual(3, len(monitor.live))
+        self.assertEqual(0, monitor.growth()["nodes"])
+        self.assertEqual(0, monitor.growth()["constants"])
+
+        self.assertEqual({}, GraphMonitor().growth())
+        self.assertGreater(live_scalars(), 0)
+
+        # the compiled kernel builds no graph to record
+        with self.assertRaises(ValueError):
+            model.fit(xs, ys, SGD(), epochs=1, compiled=True, monitor=monitor)
@@ -1,6 +1,10 @@
 import unittest
 
-from src.foundation.nn import Neuron, Layer, MLP
+from src.foundation.compiler import compile_loss
+from src.foundation.core import Scalar
+from src.foundation.lbfgs import LBFGS
+from src.foundation.metrics import mean_squared_error
+from src.foundation.nn import Neuron, Layer, MLP, SparseLayer, jvp, prune, sparsify
 from src.foundation.optimizers import SGD
 
 
@@ -24,6 +28,14 @@ class NNTests(unittest.TestCase):
 
         self.assertLessEqual("Tanh-Neuron(2)", str(n))
 
+        # drawn from the seedable generator of the initializers
+        seeded = Neuron(no_inputs=2, rng=0)
+        self.assertEqual(
+            [w_i.data for w_i in seeded.parameters()],
+            [w_i.data for w_i in Neuron(no_inputs=2, rng=0).parameters()],
+        )
+        self.assertEqual(4.0, Neuron(no_inputs=2, bias=4.0, rng=0).b.data)
+
     def test_layer(self):
         layer = Layer(no_inputs=2, no_outputs=2)
         x = [2.0, 3.0]
@@ -60,3 +72,130 @@ class NNTests(unittest.TestCase):
         predictions = [model(x) for x in xs]
         print(predictions)
         self.assertEqual(4, len(predictions))
+
+    def test_mlp_jvp(self):
+        model = MLP(no_inputs=3, no_layer_outputs=[4, 4, 2])
+        x = [1.0, -2.0, 0.5]
+        v = [0.3, 0.1, -1.0]
+
+        outs, tangents = model.jvp(x=x, v=v)
+        self.assertEqual((outs, tangents), jvp(model, x, v))
+
+        # reverse mode: one backward per output, J @ v == grad(out) . v
+        for index in range(2):
+            inputs = [Scalar(x_i) for x_i in x]
+            out = model(inputs)[index]
+            out.backward()
+
+            self.assertAlmostEqual(out.data, outs[index])
+            self.assertAlmostEqual(
+                sum(x_i.grad * v_i for x_i, v_i in zip(inputs, v)), tangents[index]
+            )
+
+    def test_prune(self):
+        model = MLP(no_inputs=4, no_layer_outputs=[10, 1])
+        prune(model, sparsity=0.9)
+
+        weights = [w_i.data for neuron in model.layers[0].neurons for w_i in neuron.w]
+        self.assertEqual(36, weights.count(0.0))
+        self.assertEqual(61, len(model.parameters()))  # pruned weights stay dense
+
+    def test_sparse_layer(self):
+        layer = Layer(no_inputs=3, no_outputs=2)
+        layer.neurons[0].w[1].data = 0.0
+        layer.neurons[1].w[0].data = 0.0
+        layer.neurons[1].w[2].data = 0.0
+        x = [1.0, -2.0, 0.5]
+        expected = [out.data for out in layer(x)]
+
+        sparse = SparseLayer(layer=layer)
+        self.assertEqual([0, 2, 3], sparse.indptr)
+        self.assertEqual([0, 2, 1], sparse.indices)
+        self.assertEqual(3 + 2, len(sparse.parameters()))  # 3 non-zeros, 2 biases
+
+        outs = sparse(x)
+        for expected_i, out in zip(expected, outs):
+            self.assertAlmostEqual(expected_i, out.data)
+
+        outs[0].backward()
+        self.assertEqual(x[0] * (1 - outs[0].data ** 2), sparse.values[0].grad)
+
+    def test_sparsify(self):
+        xs = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5], [0.5, 1.0, 3.0], [3.0, 1.0, -1.0]]
+        ys = [1.0, -1.0, -1.0, 1.0]
+
+        model = prune(MLP(no_inputs=3, no_layer_outputs=[8, 8, 1]), sparsity=0.5)
+        expected = [model(x)[0].data for x in xs]
+        tangents = model.jvp(x=xs[0], v=[1.0, 0.0, 0.0])
+        model.predict(xs)
+        dense_kernel = model._forward_kernel
+
+        sparsify(model)
+        self.assertTrue(all(isinstance(layer, SparseLayer) for layer in model.layers))
+        self.assertEqual(12 + 32 + 4 + 8 + 8 + 1, len(model.parameters()))
+
+        for expected_i, x in zip(expected, xs):
+            self.assertAlmostEqual(expected_i, model(x)[0].data)
+            self.assertAlmostEqual(expected_i, model.predict([x])[0][0])
+        self.assertEqual(tangents, model.jvp(x=xs[0], v=[1.0, 0.0, 0.0]))
+        # the forward kernel of the dense layers is dropped by sparsify
+        self.assertIsNot(dense_kernel, model._forward_kernel)
+
+        model.summary()
+        history = model.fit(xs, ys, optimizer=SGD(learning_rate=0.1), epochs=20)
+        self.assertLess(history["loss"][-1], history["loss"][0])
+
+    def test_mlp_init(self):
+        model = MLP(no_inputs=3, no_layer_outputs=[4, 1], seed=42)
+        same = MLP(no_inputs=3, no_layer_outputs=[4, 1], seed=42)
+        other = MLP(no_inputs=3, no_layer_outputs=[4, 1], seed=43)
+
+        values = [param.data for param in model.parameters()]
+        self.assertEqual(values, [param.data for param in same.parameters()])
+        self.assertNotEqual(values, [param.data for param in other.parameters()])
+
+        # layers draw from one generator, so they differ even with equal shapes
+        model = MLP(no_inputs=4, no_layer_outputs=[4, 4], init="xavier", seed=0)
+        first, second = (layer.parameters() for layer in model.layers)
+        self.assertNotEqual([p.data for p in first], [p.data for p in second])
+        self.assertEqual(0.0, model.layers[0].neurons[0].b.data)
+
+    def test_mlp_partial_fit(self):
+        xs = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5], [0.5, 1.0, 3.0], [3.0, 1.0, -1.0]]
+        ys = [1.0, -1.0, -1.0, 1.0]
+
+        model = MLP(no_inputs=3, no_layer_outputs=[4, 4, 1], seed=0)
+        expected = MLP(no_inputs=3, no_layer_outputs=[4, 4, 1], seed=0)
+        history = expected.fit(xs, ys, optimizer=SGD(learning_rate=0.1), epochs=5)
+
+        optimizer = SGD(learning_rate=0.1)
+        losses = [model.partial_fit(xs, ys, optimizer) for _ in range(5)]
+        for expected_loss, loss in zip(history["loss"], losses):
+            self.assertAlmostEqual(expected_loss, loss)
+
+        # bound once, the parameter list is reused across calls
+        parameters = optimizer.parameters
+        model.partial_fit(xs[:2], ys[:2], optimizer, compiled=True)
+        self.assertIs(parameters, optimizer.parameters)
+
+    def test_mlp_partial_fit_stream(self):
+        xs = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5], [0.5, 1.0, 3.0], [3.0, 1.0, -1.0]]
+        ys = [1.0, -1.0, -1.0, 1.0]
+        batches = [(xs[:2], ys[:2]), (xs[2:], ys[2:])]
+
+        model = MLP(no_inputs=3, no_layer_outputs=[4, 4, 1], seed=0)
+        optimizer = LBFGS()
+
+        # alternating batches, optimizer state persists across calls
+        losses = []
+        for i in range(20):
+            x, y = batches[i % 2]
+            expected = mean_squared_error(y, model.forward(x)).data
+            losses.append(model.partial_fit(x, y, optimizer, compiled=True))
+            # the loss of this batch before the update, not a cached one
+            self.assertAlmostEqual(expected, losses[-1])
+
+        self.assertGreater(optimizer.size, 0)
+        self.assertLess(losses[-2] + losses[-1], losses[0] + losses[1])
+        # the kernel is compiled once and kept on the model
+        self.assertIs(compile_loss(model), model._loss_kernel)
@@ -0,0 +1,99 @@
+import unittest
+
+from src.foundation.core import Scalar
+from src.foundation.lbfgs import LBFGS
+from src.foundation.nn import MLP
+from src.foundation.optimizers import Optimizer, SGD
+
+
+class OptimizersTests(unittest.TestCase):
+    def test_sgd(self):
+        a = Scalar(2.0)
+        optimizer = SGD(learning_rate=0.1)
+        optimizer.parameters = [a]
+
+        def closure():
+            optimizer.zero_grad()
+            loss = a**2
+            loss.backward()
+            return loss.data
+
+        self.assertEqual(4.0, optimizer.step(closure=closure))
+        self.assertAlmostEqual(1.6, a.data)
+
+    def test_step_without_closure(self):
+        xs = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5]]
+        ys = [1.0, -1.0]
+
+        class Plain(Optimizer):
+            # the step(self) contract of optimizers that need no closure
+            def step(self):
+                for param in self.parameters:
+                    param.data -= self.lr * param.grad
+
+        model = MLP(no_inputs=3, no_layer_outputs=[4, 1], seed=0)
+        expected = MLP(no_inputs=3, no_layer_outputs=[4, 1], seed=0)
+
+        history = model.fit(xs, ys, Plain(learning_rate=0.1), epochs=3)
+        expected_history = expected.fit(xs, ys, SGD(learning_rate=0.1), epochs=3)
+        self.assertEqual(expected_history["loss"], history["loss"])
+        self.assertEqual(
+            expected.partial_fit(xs, ys, SGD(learning_rate=0.1)),
+            model.partial_fit(xs, ys, Plain(learning_rate=0.1)),
+        )
+
+    def test_lbfgs_rosenbrock(self):
+        a = Scalar(-1.2)
+        b = Scalar(1.0)
+        optimizer = LBFGS(history_size=5)
+        optimizer.parameters = [a, b]
+
+        def closure():
+            optimizer.zero_grad()
+            loss = (a - 1) ** 2 + 100 * (b - a**2) ** 2
+            loss.backward()
+            return loss.data
+
+        losses = [optimizer.step(closure=closure) for _ in range(100)]
+
+        self.assertLess(losses[-1], 1e-8)
+        self.assertAlmostEqual(1.0, a.data, places=3)
+        self.assertAlmostEqual(1.0, b.data, places=3)
+        # ring buffers never grow beyond the history size
+        self.assertEqual((5, 2), optimizer.s.shape)
+        self.assertEqual(5, optimizer.size)
+
+    def test_lbfgs_new_closure(self):
+        a = Scalar(3.0)
+        optimizer = LBFGS()
+        optimizer.parameters = [a]
+
+        def closure(target):
+            def evaluate():
+                optimizer.zero_grad()
+                loss = (a - target) ** 2
+                loss.backward()
+                return loss.data
+
+            return evaluate
+
+        optimizer.step(closure=closure(0.0))
+        # the cached evaluation of the previous closure is not reused for a new one
+        expected = (a.data - 1.0) ** 2
+        self.assertAlmostEqual(expected, optimizer.step(closure=closure(1.0)))
+
+    def test_lbfgs_requires_closure(self):
+        optimizer = LBFGS()
+        optimizer.parameters = [Scalar(1.0)]
+
+        with self.assertRaises(AssertionError):
+            optimizer.step()
+
+    def test_lbfgs_fit(self):
+        xs = [[1.0, 4.0, -1.0], [2.0, -2.0, 0.5], [0.5, 1.0, 3.0], [3.0, 1.0, -1.0]]
+        ys = [1.0, -1.0, -1.0, 1.0]
+
+        model = MLP(no_inputs=3, no_layer_outputs=[4, 4, 1], seed=0)
+        history = model.fit(xs, ys, optimizer=LBFGS(), epochs=30, compiled=True)
+
+        self.assertLess(history["loss"][-1], 1e-3)
@@ -0,0 +1,52 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.foundation.nn import MLP, prune, sparsify
+from src.foundation.quantization import (
+    dense_weights,
+    quantize,
+    quantize_values,
+    scale,
+)
+
+
+class QuantizationTests(unittest.TestCase):
+    def test_quantize_values(self):
+        values = np.array([-2.0, 0.0, 0.5, 1.0])
+        step = scale(values)
+
+        self.assertEqual(2.0 / 127, step)
+        quantized = quantize_values(values, step)
+        self.assertEqual(np.int8, quantized.dtype)
+        self.assertEqual([-127, 0, 32, 64], quantized.tolist())
+
+        self.assertEqual(1.0, scale(np.zeros(3)))
+
+    def test_dense_weights(self):
+        model = prune(MLP(no_inputs=3, no_layer_outputs=[4, 1]), sparsity=0.5)
+        weights, biases = dense_weights(model.layers[0])
+        self.assertEqual((4, 3), weights.shape)
+        self.assertEqual((4,), biases.shape)
+
+        sparsify(model)
+        sparse_weights, sparse_biases = dense_weights(model.layers[0])
+        self.assertTrue(np.array_equal(weights, sparse_weights))
+        self.assertTrue(np.array_equal(biases, sparse_biases))
+
+    def test_quantize(self):
+        random.seed(0)
+        model = MLP(no_inputs=4, no_layer_outputs=[16, 16, 2], seed=0)
+        xs = [[random.uniform(-2, 2) for _ in range(4)] for _ in range(64)]
+
+        quantized = quantize(model, xs)
+        self.assertEqual(3, len(quantized.layers))
+        self.assertEqual(np.int8, quantized.layers[0].weights.dtype)
+        self.assertEqual(np.int32, quantized.layers[0].biases.dtype)
+
+        expected = np.array(model.predict(xs))
+        predictions = quantized.predict(xs)
+
+        self.assertEqual((64, 2), predictions.shape)
+        self.assertLess(np.max(np.abs(expected - predictions)), 0.05)